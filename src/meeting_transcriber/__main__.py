@@ -5,6 +5,7 @@ from __future__ import annotations
 import ctypes
 import os
 import sys
+import threading
 
 
 # cuDNNライブラリを事前にロード（他のインポートより先に実行、Linux CUDA環境のみ）
@@ -13,6 +14,10 @@ def _preload_cudnn() -> None:
     if sys.platform != 'linux':
         return
 
+    # CUDA_VISIBLE_DEVICES='' でGPUが明示的に無効化されている場合は不要
+    if os.environ.get('CUDA_VISIBLE_DEVICES') == '':
+        return
+
     try:
         import importlib.util
 
@@ -23,7 +28,11 @@ def _preload_cudnn() -> None:
         cudnn_path = list(spec.submodule_search_locations)[0]
         lib_path = os.path.join(cudnn_path, 'lib')
 
-        if not os.path.exists(lib_path):
+        # ディレクトリを1回だけ走査して存在するライブラリを把握する
+        try:
+            with os.scandir(lib_path) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
             return
 
         # 必要なライブラリを順番にロード
@@ -38,31 +47,59 @@ def _preload_cudnn() -> None:
             'libcudnn_heuristic.so.9',
         ]
 
+        # RTLD_NOW で依存シンボルをロード時に解決し、Whisper初期化時の遅延バインドを避ける
+        mode = os.RTLD_NOW | ctypes.RTLD_GLOBAL
         for lib in libs:
-            lib_file = os.path.join(lib_path, lib)
-            if os.path.exists(lib_file):
-                try:
-                    ctypes.CDLL(lib_file, mode=ctypes.RTLD_GLOBAL)
-                except OSError:
-                    pass
+            if lib not in present:
+                continue
+            try:
+                ctypes.CDLL(os.path.join(lib_path, lib), mode=mode)
+            except OSError:
+                pass
     except Exception:
         pass
 
 
-_preload_cudnn()
+def _preload_cudnn_async() -> threading.Thread:
+    """cuDNNのロードをバックグラウンドスレッドで開始する."""
+    thread = threading.Thread(target=_preload_cudnn, name='cudnn-preload', daemon=True)
+    thread.start()
+    return thread
+
+
+# 引数なしで単体指定された場合、Whisperを使わずに終了するフラグ（cuDNNの事前ロードを省く）
+HELP_FLAGS = ('-h', '--help')
+INFO_FLAGS = ('--list-devices', '--list-templates', '--show-config')
+
+
+def _is_quick_exit() -> bool:
+    """ヘルプや情報表示のみで終了する呼び出しかどうかを返す."""
+    return len(sys.argv) == 2 and sys.argv[1] in HELP_FLAGS + INFO_FLAGS
+
+
+# dlopenは時間がかかるため、引数パースや他のインポートと並行して実行する
+_cudnn_preload_thread = None if _is_quick_exit() else _preload_cudnn_async()
 
 import argparse  # noqa: E402
 from pathlib import Path  # noqa: E402
 
-from dotenv import load_dotenv  # noqa: E402
-from meeting_transcriber.audio import AudioRecorder  # noqa: E402
+from meeting_transcriber.config import CONFIG_FIELDS  # noqa: E402
 from meeting_transcriber.config import Config  # noqa: E402
-from meeting_transcriber.main import MeetingTranscriber  # noqa: E402
-from meeting_transcriber.templates import TemplateManager  # noqa: E402
+
+# 引数名とConfigのフィールド名が異なるものの対応表（同名のものは省略）
+ARG_TO_CONFIG_FIELD = {
+    'model': 'model_size',
+    'device': 'device_id',
+    'output': 'output_dir',
+    'filename': 'filename_format',
+    'simple_output': 'simple_output_dir',
+}
 
 
 def list_devices() -> None:
     """利用可能な音声デバイスを表示する."""
+    from meeting_transcriber.audio import AudioRecorder
+
     devices = AudioRecorder.list_devices()
     print('利用可能な入力デバイス:')
     print('-' * 60)
@@ -74,6 +111,8 @@ def list_devices() -> None:
 
 def list_templates(templates_dir: Path) -> None:
     """利用可能なテンプレートを表示する."""
+    from meeting_transcriber.templates import TemplateManager
+
     manager = TemplateManager(templates_dir)
     manager.install_builtin_templates()
     templates = manager.list_templates()
@@ -212,6 +251,12 @@ def parse_args() -> argparse.Namespace:
     )
 
     # その他
+    parser.add_argument(
+        '--env-file',
+        type=Path,
+        default=None,
+        help='読み込む.envファイル (default: カレントディレクトリから親へ探した.env)',
+    )
     parser.add_argument(
         '--show-config',
         action='store_true',
@@ -226,12 +271,70 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _find_env_file() -> Path | None:
+    """カレントディレクトリから親ディレクトリへ順に .env を探す."""
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        candidate = directory / '.env'
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def load_env(env_file: Path | None) -> None:
+    """環境変数を .env ファイルから読み込む.
+
+    明示的に指定されたファイル（--env-file / MEETING_TRANSCRIBER_ENVFILE）が存在しない場合はエラーにする。
+    指定がなければカレントディレクトリから親へ .env を探し、見つからなければ何もしない。
+    """
+    if env_file is None:
+        env_path = os.environ.get('MEETING_TRANSCRIBER_ENVFILE')
+        env_file = Path(env_path) if env_path else None
+
+    if env_file is not None:
+        env_file = env_file.expanduser()
+        if not env_file.is_file():
+            raise FileNotFoundError(f'.envファイルが見つかりません: {env_file}')
+    else:
+        env_file = _find_env_file()
+        # 見つからない場合はdotenvのインポートを省く
+        if env_file is None:
+            return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_file)
+
+
+def run_info_command(flag: str) -> int:
+    """情報表示フラグを処理する."""
+    if flag == '--list-devices':
+        list_devices()
+        return 0
+
+    config = Config.load_default()
+    if flag == '--list-templates':
+        list_templates(config.templates_dir)
+    else:
+        show_config(config)
+    return 0
+
+
 def main() -> int:
     """メイン関数."""
-    # 環境変数を読み込み
-    load_dotenv()
+    # 情報表示フラグ単体なら、argparseの構築や重いモジュールのインポートを省いて即座に処理する
+    info_flag = sys.argv[1] if len(sys.argv) == 2 and sys.argv[1] in INFO_FLAGS else None
+    args = None if info_flag else parse_args()
+
+    # 環境変数を読み込み（情報表示のみの場合も、表示する設定が .env に依存しうるので先に読む）
+    try:
+        load_env(args.env_file if args else None)
+    except FileNotFoundError as e:
+        print(f'エラー: {e}', file=sys.stderr)
+        return 1
 
-    args = parse_args()
+    if info_flag:
+        return run_info_command(info_flag)
 
     # デバイス一覧表示
     if args.list_devices:
@@ -251,41 +354,29 @@ def main() -> int:
         show_config(config)
         return 0
 
-    # コマンドライン引数をマージ
-    merge_kwargs = {}
-    if args.model:
-        merge_kwargs['model_size'] = args.model
-    if args.language:
-        merge_kwargs['language'] = args.language
-    if args.device is not None:
-        merge_kwargs['device_id'] = args.device
+    # コマンドライン引数をマージ（指定されなかった引数は None / False のまま）
+    merge_kwargs = {
+        ARG_TO_CONFIG_FIELD.get(key, key): value
+        for key, value in vars(args).items()
+        if ARG_TO_CONFIG_FIELD.get(key, key) in CONFIG_FIELDS and value is not None and value is not False
+    }
+    for key in ('output_dir', 'simple_output_dir'):
+        if key in merge_kwargs:
+            merge_kwargs[key] = merge_kwargs[key].expanduser()
     if args.no_realtime:
         merge_kwargs['realtime_display'] = False
-    if args.compute_device:
-        merge_kwargs['compute_device'] = args.compute_device
-    if args.backend:
-        merge_kwargs['backend'] = args.backend
-    if args.output:
-        merge_kwargs['output_dir'] = args.output.expanduser()
-    if args.filename:
-        merge_kwargs['filename_format'] = args.filename
-    if args.simple_output:
-        merge_kwargs['simple_output_dir'] = args.simple_output.expanduser()
-    if args.open_after:
-        merge_kwargs['open_after'] = True
-    if args.template:
-        merge_kwargs['template'] = args.template
-    if args.auto_update:
-        merge_kwargs['auto_update'] = True
-    if args.update_interval:
-        merge_kwargs['update_interval'] = args.update_interval
-    if args.version_history:
-        merge_kwargs['version_history'] = True
 
     config = config.merge_args(**merge_kwargs)
 
+    # Whisperモデル読み込み前にcuDNNのロード完了を待つ
+    if _cudnn_preload_thread is not None:
+        _cudnn_preload_thread.join()
+
+    # faster-whisper等の重い依存を含むため、実際に起動する場合のみインポートする
+    from meeting_transcriber.main import MeetingTranscriber
+
     try:
-        transcriber = MeetingTranscriber(config)
+        transcriber = MeetingTranscriber(config, tui=not args.no_tui)
         if args.no_tui:
             transcriber.run()
         else:
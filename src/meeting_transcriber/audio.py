@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import queue
+from collections import deque
 import threading
 from typing import TYPE_CHECKING
 
@@ -12,9 +12,42 @@ import sounddevice as sd
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# キャプチャ時のサンプル形式。float32の半分のサイズでリング・キュー・転送の帯域を抑える
+SAMPLE_DTYPE = np.int16
+# int16 → [-1.0, 1.0) の float32 への変換係数
+INT16_SCALE = 1.0 / 32768.0
+
+
+def to_float32(audio: np.ndarray) -> np.ndarray:
+    """int16の音声をWhisperが扱う float32 に変換する（float32ならそのまま返す）."""
+    if audio.dtype == np.float32:
+        return audio
+    if audio.dtype == np.int16:
+        return audio.astype(np.float32) * np.float32(INT16_SCALE)
+    return audio.astype(np.float32)
+
+
+def detach_chunk(audio: np.ndarray) -> np.ndarray:
+    """チャンクをリングバッファから切り離した int16 の読み取り専用コピーにする.
+
+    スレッド間の受け渡しは int16 のまま行い、float32 への変換は推論の直前にだけ行う。
+    """
+    if audio.dtype == SAMPLE_DTYPE:
+        chunk = audio.copy()
+    elif np.issubdtype(audio.dtype, np.floating):
+        chunk = np.clip(audio * 32768.0, -32768, 32767).astype(SAMPLE_DTYPE)
+    else:
+        chunk = audio.astype(SAMPLE_DTYPE)
+    chunk.flags.writeable = False
+    return chunk
+
 
 class AudioRecorder:
-    """音声入力を管理するクラス."""
+    """音声入力を管理するクラス.
+
+    use_pinned はチャンクを直接GPUへ転送する利用者向けのAPI専用の設定で、アプリ本体では使わない
+    （MeetingTranscriber はチャンクを int16 のコピーに切り離してから float32 に変換するため効果がない）。
+    """
 
     def __init__(
         self,
@@ -22,6 +55,7 @@ class AudioRecorder:
         sample_rate: int = 16000,
         step_duration: float = 5.0,  # ステップ間隔（秒）
         window_duration: float = 15.0,  # ウィンドウ長（秒）
+        use_pinned: bool = False,  # 固定長のピン留めメモリでチャンクを出力（CUDA向け）
     ) -> None:
         self.device_id = device_id
         self.sample_rate = sample_rate
@@ -29,17 +63,110 @@ class AudioRecorder:
         self.window_duration = window_duration
         self.step_samples = int(sample_rate * step_duration)
         self.window_samples = int(sample_rate * window_duration)
+        self.use_pinned = use_pinned
 
-        # maxsize=10 で約50秒分（5秒ステップ × 10）を保持、それ以上は古いチャンクを破棄
-        self._audio_queue: queue.Queue[np.ndarray] = queue.Queue(maxsize=10)
-        self._buffer: list[np.ndarray] = []
-        self._buffer_samples = 0
-        self._keep_buffer: np.ndarray | None = None  # 前のウィンドウの末尾を保持
+        # maxlen=10 で約50秒分（5秒ステップ × 10）を保持、それ以上は古いチャンクを破棄
+        # 生産者（音声コールバック）と消費者（文字起こし）が1つずつなので、
+        # deque の append/popleft のアトミック性に任せてロックを取らない
+        self._audio_queue: deque[np.ndarray] = deque(maxlen=10)
+        self._audio_event = threading.Event()  # チャンク到着の通知
+        # 音声を保持するミラーリングバッファ。容量 capacity の領域を2回分確保し、各サンプルを
+        # [pos] と [pos + capacity] の両方に書くことで、任意の直近区間を連続したビューとして取り出せる。
+        # 出力したビューは queue 内のチャンク数 + 消費中の分だけ上書きされない容量を持たせる
+        self._ring_capacity = self.window_samples + (self._audio_queue.maxlen + 2) * self.step_samples
+        self._ring = np.empty(2 * self._ring_capacity, dtype=SAMPLE_DTYPE)
+        self._write_pos = 0
+        self._ring_filled = 0  # リングに有効なサンプル数（最大 window_samples）
+        self._buffer_samples = 0  # 前回チャンク出力以降に追加されたサンプル数
         self._stream: sd.InputStream | None = None
         self._is_recording = False
         self._is_paused = False
         self._lock = threading.Lock()
         self._on_chunk_callback: Callable[[np.ndarray], None] | None = None
+        # use_pinned時の出力スロット（キュー容量 + 消費側・書き込み側の2枠）
+        self._pinned_pool: list[np.ndarray] = []
+        self._pinned_index = 0
+
+    def _allocate_pinned_pool(self) -> None:
+        """固定長の出力バッファプールを確保する.
+
+        CUDAが利用可能ならtorchのピン留めメモリを使い、ホスト→デバイス転送時の
+        ステージングコピーを省く。利用できない場合は通常のnumpy配列で固定長のみ保証する。
+        """
+        if self._pinned_pool:
+            return
+
+        pool_size = self._audio_queue.maxlen + 2
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                self._pinned_pool = [
+                    torch.empty(self.window_samples, dtype=torch.int16, pin_memory=True).numpy()
+                    for _ in range(pool_size)
+                ]
+                return
+        except ImportError:
+            pass
+
+        self._pinned_pool = [np.empty(self.window_samples, dtype=SAMPLE_DTYPE) for _ in range(pool_size)]
+
+    def _next_pinned_slot(self) -> np.ndarray:
+        """次の出力スロットを取得する（ロック内で呼び出す）."""
+        slot = self._pinned_pool[self._pinned_index]
+        self._pinned_index = (self._pinned_index + 1) % len(self._pinned_pool)
+        return slot
+
+    def _write_ring(self, samples: np.ndarray) -> None:
+        """リングバッファに音声を書き込む（ロック内で呼び出す）.
+
+        samples は indata[:, 0] のビューをそのまま受け取り、リングへのコピー1回で済ませる。
+        """
+        if samples.dtype != self._ring.dtype:
+            # ストリームは int16 で開くため通常は通らない（他形式のデバイス出力への保険）
+            if np.issubdtype(samples.dtype, np.floating):
+                samples = np.clip(samples * 32768.0, -32768, 32767)
+            samples = samples.astype(self._ring.dtype)
+        n = len(samples)
+        capacity = self._ring_capacity
+        if n > capacity:
+            samples = samples[-capacity:]
+        m = len(samples)
+
+        wp = self._write_pos
+        first = min(m, capacity - wp)
+        for base in (0, capacity):
+            np.copyto(self._ring[base + wp : base + wp + first], samples[:first])
+            if first < m:
+                # 境界をまたぐ場合は先頭に折り返して書き込む
+                np.copyto(self._ring[base : base + m - first], samples[first:])
+        self._write_pos = (wp + m) % capacity
+
+        self._ring_filled = min(self._ring_filled + n, self.window_samples)
+        self._buffer_samples += n
+
+    def _read_ring(self, num_samples: int, out: np.ndarray | None = None) -> np.ndarray:
+        """リングバッファの末尾 num_samples 分を時系列順に取り出す（ロック内で呼び出す）.
+
+        out を指定しない場合はコピーせず、リング内の読み取り専用ビューを返す。
+        out を指定した場合はその配列の末尾に書き込み、足りない先頭は無音で埋める。
+        """
+        num_samples = min(num_samples, self._ring_filled)
+        end = self._write_pos + self._ring_capacity
+        view = self._ring[end - num_samples : end]
+        if out is None:
+            view.flags.writeable = False
+            return view
+
+        head = len(out) - num_samples
+        out[:head] = 0
+        np.copyto(out[head:], view)
+        return out
+
+    def _put_chunk(self, chunk: np.ndarray) -> None:
+        """キューにチャンクを追加する。満杯の場合は古いチャンクが自動的に破棄される."""
+        self._audio_queue.append(chunk)
+        self._audio_event.set()
 
     def _audio_callback(
         self,
@@ -53,42 +180,16 @@ class AudioRecorder:
             return
 
         with self._lock:
-            self._buffer.append(indata.copy().flatten())
-            self._buffer_samples += len(indata)
+            self._write_ring(indata[:, 0])
 
             # ステップ間隔ごとにチャンクを出力
             if self._buffer_samples >= self.step_samples:
-                new_audio = np.concatenate(self._buffer)
-
-                # 前のウィンドウの末尾 + 新しい音声 でウィンドウを構成
-                if self._keep_buffer is not None:
-                    chunk = np.concatenate([self._keep_buffer, new_audio])
-                else:
-                    chunk = new_audio
-
-                # ウィンドウ長を超えた場合は切り詰め
-                if len(chunk) > self.window_samples:
-                    chunk = chunk[-self.window_samples :]
-
-                # 次回のために末尾を保持（window - step = 10秒分）
-                keep_samples = self.window_samples - self.step_samples
-                if len(chunk) > keep_samples:
-                    self._keep_buffer = chunk[-keep_samples:]
-                else:
-                    self._keep_buffer = chunk.copy()
-
-                self._buffer = []
+                # 前のウィンドウの末尾 + 新しい音声 でウィンドウを構成（最大 window_samples）
+                out = self._next_pinned_slot() if self.use_pinned else None
+                chunk = self._read_ring(self.window_samples, out)
                 self._buffer_samples = 0
 
-                # キューが満杯の場合は古いチャンクを破棄して新しいものを追加
-                try:
-                    self._audio_queue.put_nowait(chunk)
-                except queue.Full:
-                    try:
-                        self._audio_queue.get_nowait()  # 古いチャンクを破棄
-                        self._audio_queue.put_nowait(chunk)
-                    except queue.Empty:
-                        pass
+                self._put_chunk(chunk)
 
                 if self._on_chunk_callback:
                     self._on_chunk_callback(chunk)
@@ -98,12 +199,14 @@ class AudioRecorder:
         self._on_chunk_callback = on_chunk
         self._is_recording = True
         self._is_paused = False
+        if self.use_pinned:
+            self._allocate_pinned_pool()
 
         self._stream = sd.InputStream(
             device=self.device_id,
             samplerate=self.sample_rate,
             channels=1,
-            dtype=np.float32,
+            dtype=SAMPLE_DTYPE,
             callback=self._audio_callback,
         )
         self._stream.start()
@@ -118,10 +221,11 @@ class AudioRecorder:
 
         # 残りのバッファをフラッシュ
         with self._lock:
-            if self._buffer:
-                chunk = np.concatenate(self._buffer)
-                self._audio_queue.put(chunk)
-                self._buffer = []
+            if self._buffer_samples > 0:
+                # use_pinned時はコールバックと同じく固定長のスロットに書き込む（先頭は無音で埋まる）
+                out = self._next_pinned_slot() if self.use_pinned and self._pinned_pool else None
+                chunk = self._read_ring(self._buffer_samples, out)
+                self._put_chunk(chunk)
                 self._buffer_samples = 0
 
     def pause(self) -> None:
@@ -136,12 +240,30 @@ class AudioRecorder:
         """一時停止中かどうかを返す."""
         return self._is_paused
 
-    def get_audio_chunk(self, timeout: float = 0.1) -> np.ndarray | None:
-        """キューから音声チャンクを取得する."""
+    def get_audio_chunk(self, timeout: float | None = 0.1) -> np.ndarray | None:
+        """キューから音声チャンクを取得する.
+
+        timeout=None の場合はチャンクが届くか wake() が呼ばれるまで待ち続ける。
+
+        チャンクは int16（SAMPLE_DTYPE）で返す。float32が必要な場合は to_float32 で変換する。
+        通常時はリングバッファ内の読み取り専用ビューを返す（キュー容量 + 2ステップ分は上書きされない）。
+        use_pinned時は常に window_samples 長のピン留めバッファのビューを返す。
+        スロットは再利用されるため、次のチャンク取得までに消費（デバイス転送）すること。
+        """
+        self._audio_event.wait(timeout)
+        # 取り出す前にクリアし、残りがあれば再度セットする（通知の取りこぼしを防ぐ）
+        self._audio_event.clear()
         try:
-            return self._audio_queue.get(timeout=timeout)
-        except queue.Empty:
+            chunk = self._audio_queue.popleft()
+        except IndexError:
             return None
+        if self._audio_queue:
+            self._audio_event.set()
+        return chunk
+
+    def wake(self) -> None:
+        """get_audio_chunk で待機中のスレッドを起こす（チャンクがなければ None が返る）."""
+        self._audio_event.set()
 
     @staticmethod
     def list_devices() -> list[dict]:
@@ -23,6 +23,16 @@ class AnthropicAPIBackend(Backend):
         )
         return response.content[0].text
 
+    def generate_cached(self, system: str, prompt: str) -> str:
+        """固定の指示をシステムプロンプトとしてキャッシュ指定して生成する."""
+        response = self.client.messages.create(
+            model='claude-sonnet-4-20250514',
+            max_tokens=8192,
+            system=[{'type': 'text', 'text': system, 'cache_control': {'type': 'ephemeral'}}],
+            messages=[{'role': 'user', 'content': prompt}],
+        )
+        return response.content[0].text
+
     @staticmethod
     def check_available() -> bool:
         """APIキーが設定されているか確認する."""
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+# generate_many の同時実行数の上限（バックエンドのレート制限を考慮）
+DEFAULT_MAX_CONCURRENCY = 6
 
 
 class Backend(ABC):
@@ -13,6 +17,25 @@ class Backend(ABC):
     def generate(self, prompt: str) -> str:
         """プロンプトからテキストを生成する."""
 
+    def generate_cached(self, system: str, prompt: str) -> str:
+        """固定の指示（system）と可変部分（prompt）を分けてテキストを生成する.
+
+        プレフィックスキャッシュに対応したバックエンドは system をキャッシュ対象として送る。
+        非対応のバックエンドでは連結した1つのプロンプトとして扱う。
+        """
+        return self.generate(f'{system}\n{prompt}')
+
+    def generate_many(self, prompts: list[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list[str]:
+        """複数の独立したプロンプトを並行に処理し、入力順に結果を返す."""
+        if len(prompts) <= 1:
+            return [self.generate(prompt) for prompt in prompts]
+
+        with ThreadPoolExecutor(max_workers=min(len(prompts), max_concurrency)) as executor:
+            return list(executor.map(self.generate, prompts))
+
+    def close(self) -> None:
+        """バックエンドが保持しているリソースを解放する（既定では何もしない）."""
+
     @staticmethod
     @abstractmethod
     def check_available() -> bool:
@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 import os
+import threading
 
-import anyio
 from meeting_transcriber.backends.base import Backend
+from meeting_transcriber.backends.base import DEFAULT_MAX_CONCURRENCY
+
+
+@lru_cache(maxsize=1)
+def _sdk_installed() -> bool:
+    """Claude Agent SDKがインストールされているか確認する（結果をキャッシュ）."""
+    try:
+        from claude_code_sdk import query  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
 
 
 class ClaudeAgentBackend(Backend):
@@ -16,6 +30,11 @@ class ClaudeAgentBackend(Backend):
 
         self.options = ClaudeCodeOptions(max_tokens=8192)
 
+        # 呼び出しごとにイベントループを作り直さないよう、専用スレッドで常駐させる
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name='claude-agent-loop', daemon=True)
+        self._loop_thread.start()
+
     async def generate_async(self, prompt: str) -> str:
         """非同期でテキストを生成する."""
         from claude_code_sdk import query
@@ -28,16 +47,37 @@ class ClaudeAgentBackend(Backend):
                         result_parts.append(block.text)
         return ''.join(result_parts)
 
+    async def generate_many_async(
+        self, prompts: list[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[str]:
+        """複数のプロンプトを単一のイベントループ上で並行に処理する."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_async(prompt)
+
+        return list(await asyncio.gather(*(run_one(prompt) for prompt in prompts)))
+
     def generate(self, prompt: str) -> str:
         """プロンプトから議事録を生成する."""
-        return anyio.from_thread.run_sync(lambda: anyio.run(self.generate_async, prompt))
+        return asyncio.run_coroutine_threadsafe(self.generate_async(prompt), self._loop).result()
+
+    def generate_many(self, prompts: list[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list[str]:
+        """複数のプロンプトをスレッドを増やさずに並行処理する."""
+        coro = self.generate_many_async(prompts, max_concurrency)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """常駐させたイベントループを止め、スレッドの終了を待ってループを閉じる."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
 
     @staticmethod
     def check_available() -> bool:
         """Claude Agent SDKとOAuthトークンが利用可能か確認する."""
-        try:
-            from claude_code_sdk import query  # noqa: F401
-
-            return bool(os.environ.get('CLAUDE_CODE_OAUTH_TOKEN'))
-        except ImportError:
-            return False
+        # トークンの確認は安価なので先に行い、不要なSDKのインポートを避ける
+        return bool(os.environ.get('CLAUDE_CODE_OAUTH_TOKEN')) and _sdk_installed()
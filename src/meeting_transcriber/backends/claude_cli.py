@@ -2,45 +2,258 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
 import os
+import select
 import subprocess
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING
 
+from meeting_transcriber.backends.base import DEFAULT_MAX_CONCURRENCY
 from meeting_transcriber.backends.base import Backend
 
+if TYPE_CHECKING:
+    from typing import IO
+
+# 1回の生成のタイムアウト（秒）
+GENERATE_TIMEOUT = 120
+# 常駐プロセスでの生成がこの回数続けて失敗したら、以降は都度起動する方式のみを使う
+STREAM_MAX_FAILURES = 3
+# エラーメッセージに含めるCLIの標準エラー出力の最大バイト数（末尾から）
+STDERR_TAIL_BYTES = 4096
+# 使い終えたプロセスが標準入力を閉じてから終了するまで待つ時間（秒）。超えたらkillする
+PROC_EXIT_TIMEOUT = 5
+
+# stream-jsonのフレームはmsgspec（extra: fast）があれば高速にデコードする（未インストールなら標準のjson）
+try:
+    import msgspec
+
+    _decode_frame = msgspec.json.Decoder(dict).decode
+    _FRAME_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, msgspec.DecodeError)
+except ImportError:
+    _decode_frame = json.loads
+    _FRAME_DECODE_ERRORS = (ValueError,)
+
+
+@lru_cache(maxsize=1)
+def _cli_help() -> str | None:
+    """`claude --help` の出力を取得する。CLIが使えない場合はNone.
+
+    利用可否とstream-json対応の判定を1回の起動で済ませるためキャッシュする。
+    """
+    try:
+        result = subprocess.run(
+            ['claude', '--help'],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _cli_env() -> dict[str, str]:
+    """CLI実行用の環境変数を作成する."""
+    # ANTHROPIC_API_KEY があるとAPI課金になるので一時的に除去
+    env = os.environ.copy()
+    env.pop('ANTHROPIC_API_KEY', None)
+    return env
+
 
 class ClaudeCLIBackend(Backend):
-    """Claude Code CLIをsubprocessで呼び出し（Maxプラン活用）."""
+    """Claude Code CLIをsubprocessで呼び出し（Maxプラン活用）.
+
+    CLIがstream-json入出力に対応していれば、次の生成用のプロセスを事前に起動しておき、
+    標準入出力でプロンプトをやり取りして呼び出し時の起動待ちを省く。
+    前のプロンプトの会話履歴を引き継がないよう、プロセスは1回の生成ごとに作り直す。
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen | None = None
+        self._proc_stderr: IO[bytes] | None = None
+        self._proc_lock = threading.Lock()
+        self._reapers: list[threading.Thread] = []  # 使い終えたプロセスを終了させているスレッド
+        self._read_buffer = b''
+        self._stream_supported = self._detect_stream_support()
+        self._stream_failures = 0  # 常駐プロセスでの生成の連続失敗回数
+
+    @staticmethod
+    def _detect_stream_support() -> bool:
+        """CLIがstream-json入出力に対応しているか確認する."""
+        help_text = _cli_help()
+        return help_text is not None and '--input-format' in help_text
 
     def generate(self, prompt: str) -> str:
         """プロンプトから議事録を生成する."""
-        # ANTHROPIC_API_KEY があるとAPI課金になるので一時的に除去
-        env = os.environ.copy()
-        env.pop('ANTHROPIC_API_KEY', None)
+        if self._stream_supported:
+            with self._proc_lock:
+                try:
+                    result = self._generate_stream(prompt)
+                    self._stream_failures = 0
+                    return result
+                except (OSError, TimeoutError, *_FRAME_DECODE_ERRORS):
+                    # 今回は従来方式で生成し直す（続けて失敗する場合のみ常駐プロセスを使わなくする）
+                    self._close_proc()
+                    self._stream_failures += 1
+                    if self._stream_failures >= STREAM_MAX_FAILURES:
+                        self._stream_supported = False
+
+        return self._generate_oneshot(prompt)
+
+    def generate_many(self, prompts: list[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list[str]:
+        """複数のプロンプトを並行処理する.
+
+        常駐プロセスは1会話ずつしか処理できないため、並行時は都度起動する。
+        """
+        if len(prompts) <= 1:
+            return [self.generate(prompt) for prompt in prompts]
 
+        with ThreadPoolExecutor(max_workers=min(len(prompts), max_concurrency)) as executor:
+            return list(executor.map(self._generate_oneshot, prompts))
+
+    def _generate_oneshot(self, prompt: str) -> str:
+        """CLIをプロンプトごとに起動して生成する."""
         result = subprocess.run(
             ['claude', '-p', prompt, '--output-format', 'text'],
             capture_output=True,
-            text=True,
-            timeout=120,
-            env=env,
+            timeout=GENERATE_TIMEOUT,
+            env=_cli_env(),
             check=False,
         )
 
         if result.returncode != 0:
-            raise RuntimeError(f'Claude CLI error: {result.stderr}')
+            raise RuntimeError(f'Claude CLI error: {result.stderr.decode("utf-8", errors="replace")}')
+
+        # バイト列で受け取り、最後に1回だけデコードする
+        return result.stdout.decode('utf-8').strip()
+
+    def _generate_stream(self, prompt: str) -> str:
+        """常駐プロセスにプロンプトを送り、ターン終了まで応答を読む（_proc_lock内で呼び出す）."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._start_proc()
+
+        message = {
+            'type': 'user',
+            'message': {'role': 'user', 'content': [{'type': 'text', 'text': prompt}]},
+        }
+        self._proc.stdin.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+        self._proc.stdin.flush()
+
+        deadline = time.monotonic() + GENERATE_TIMEOUT
+        while True:
+            line = self._read_line(deadline).strip()
+            if not line:
+                continue
+            event = _decode_frame(line)
+            if event.get('type') != 'result':
+                continue
+            if event.get('is_error'):
+                error = f'Claude CLI error: {event.get("result", "")}{self._stderr_tail()}'
+                self._start_proc()
+                raise RuntimeError(error)
+            # 会話を引き継がないよう、次の生成には新しいプロセスを使う（起動は次の呼び出しまでに進む）
+            self._start_proc()
+            return str(event.get('result', '')).strip()
+
+    def _start_proc(self) -> None:
+        """stream-jsonモードでCLIを起動する.
+
+        標準エラー出力は読まれないままパイプが詰まらないよう一時ファイルに受け、失敗時の診断に使う。
+        前のプロセスの終了待ちは生成の応答を遅らせないようバックグラウンドで行う。
+        """
+        if self._proc is not None:
+            reaper = threading.Thread(target=self._retire_proc, args=self._detach_proc(), daemon=True)
+            reaper.start()
+            self._reapers = [thread for thread in self._reapers if thread.is_alive()]
+            self._reapers.append(reaper)
+        self._proc_stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(
+            [
+                'claude',
+                '-p',
+                '--input-format',
+                'stream-json',
+                '--output-format',
+                'stream-json',
+                '--verbose',
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._proc_stderr,
+            env=_cli_env(),
+            bufsize=0,
+        )
+        self._read_buffer = b''
+
+    def _stderr_tail(self) -> str:
+        """常駐プロセスの標準エラー出力の末尾を返す（エラーメッセージに付け加える用）."""
+        if self._proc_stderr is None:
+            return ''
+        self._proc_stderr.seek(0, os.SEEK_END)
+        size = self._proc_stderr.tell()
+        self._proc_stderr.seek(max(0, size - STDERR_TAIL_BYTES))
+        tail = self._proc_stderr.read().decode('utf-8', errors='replace').strip()
+        return f'\n{tail}' if tail else ''
 
-        return result.stdout.strip()
+    def _read_line(self, deadline: float) -> bytes:
+        """常駐プロセスの標準出力から1行読む."""
+        while b'\n' not in self._read_buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError('Claude CLI の応答がタイムアウトしました')
+
+            ready, _, _ = select.select([self._proc.stdout], [], [], remaining)
+            if not ready:
+                continue
+
+            data = os.read(self._proc.stdout.fileno(), 65536)
+            if not data:
+                raise OSError(f'Claude CLI プロセスが終了しました{self._stderr_tail()}')
+            self._read_buffer += data
+
+        line, self._read_buffer = self._read_buffer.split(b'\n', 1)
+        return line
+
+    def _detach_proc(self) -> tuple[subprocess.Popen, IO[bytes] | None]:
+        """常駐プロセスと標準エラー出力の一時ファイルを切り離して返す."""
+        proc, stderr = self._proc, self._proc_stderr
+        self._proc = None
+        self._proc_stderr = None
+        return proc, stderr
+
+    @staticmethod
+    def _retire_proc(proc: subprocess.Popen, stderr: IO[bytes] | None) -> None:
+        """標準入力を閉じてプロセスの終了を待つ（終わらなければkillし、ゾンビを残さないよう回収する）."""
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=PROC_EXIT_TIMEOUT)
+        except Exception:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        if stderr is not None:
+            stderr.close()
+
+    def _close_proc(self) -> None:
+        """常駐プロセスを終了する."""
+        if self._proc is not None:
+            self._retire_proc(*self._detach_proc())
+
+    def close(self) -> None:
+        """常駐プロセスを終了し、バックグラウンドでの終了待ちも完了させる."""
+        with self._proc_lock:
+            self._close_proc()
+            for reaper in self._reapers:
+                reaper.join()
+            self._reapers = []
 
     @staticmethod
     def check_available() -> bool:
         """Claude CLIが利用可能か確認する."""
-        try:
-            result = subprocess.run(
-                ['claude', '--version'],
-                capture_output=True,
-                timeout=5,
-                check=False,
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return _cli_help() is not None
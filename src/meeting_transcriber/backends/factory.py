@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
-from meeting_transcriber.backends.api import AnthropicAPIBackend
-from meeting_transcriber.backends.base import Backend
-from meeting_transcriber.backends.claude_agent import ClaudeAgentBackend
-from meeting_transcriber.backends.claude_cli import ClaudeCLIBackend
-from meeting_transcriber.config import Config
+if TYPE_CHECKING:
+    from meeting_transcriber.backends.base import Backend
+    from meeting_transcriber.config import Config
+
+# 各バックエンドは依存ライブラリ（anthropic, anyio, claude_code_sdk）が重いため、
+# 実際に選択された分岐でのみインポートする
 
 
 def get_backend(config: Config) -> Backend:
@@ -16,10 +18,14 @@ def get_backend(config: Config) -> Backend:
     if config.backend == 'api':
         if not os.environ.get('ANTHROPIC_API_KEY'):
             raise RuntimeError('ANTHROPIC_API_KEY が設定されていません')
+        from meeting_transcriber.backends.api import AnthropicAPIBackend
+
         print('Anthropic API を使用します（従量課金）')
         return AnthropicAPIBackend()
 
     if config.backend == 'claude-agent':
+        from meeting_transcriber.backends.claude_agent import ClaudeAgentBackend
+
         if not ClaudeAgentBackend.check_available():
             raise RuntimeError(
                 'CLAUDE_CODE_OAUTH_TOKEN が見つかりません\nclaude setup-token で OAuthトークンを取得してください'
@@ -28,21 +34,29 @@ def get_backend(config: Config) -> Backend:
         return ClaudeAgentBackend()
 
     if config.backend == 'claude-cli':
+        from meeting_transcriber.backends.claude_cli import ClaudeCLIBackend
+
         if not ClaudeCLIBackend.check_available():
             raise RuntimeError('Claude Code CLI が見つかりません')
         print('Claude Code CLI を使用します（Maxプラン）')
         return ClaudeCLIBackend()
 
     # auto: 利用可能なバックエンドを自動選択
+    from meeting_transcriber.backends.claude_agent import ClaudeAgentBackend
+
     if ClaudeAgentBackend.check_available():
         print('Claude Agent SDK を使用します（Maxプラン）')
         return ClaudeAgentBackend()
 
+    from meeting_transcriber.backends.claude_cli import ClaudeCLIBackend
+
     if ClaudeCLIBackend.check_available():
         print('Claude Code CLI を使用します（Maxプラン）')
         return ClaudeCLIBackend()
 
     if os.environ.get('ANTHROPIC_API_KEY'):
+        from meeting_transcriber.backends.api import AnthropicAPIBackend
+
         print('Anthropic API を使用します（従量課金）')
         return AnthropicAPIBackend()
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from meeting_transcriber.backends.base import Backend
     from meeting_transcriber.config import TranscriptEntry
@@ -76,7 +78,7 @@ class Chunk:
 
     def to_text(self) -> str:
         """テキストに変換."""
-        return '\n'.join(str(e) for e in self.entries)
+        return '\n'.join(e.formatted for e in self.entries)
 
 
 class ChunkSplitter:
@@ -90,14 +92,17 @@ class ChunkSplitter:
         if not transcripts:
             return []
 
-        total_text = '\n'.join(str(t) for t in transcripts)
+        # 各エントリの文字数（改行込み）の累積和を一度だけ計算する
+        # offsets[i] はエントリ i より前の全テキスト長
+        lengths = np.fromiter((len(t.formatted) + 1 for t in transcripts), dtype=np.int64, count=len(transcripts))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
 
-        # 閾値以下なら分割不要
-        if len(total_text) <= CHUNK_THRESHOLD:
+        # 閾値以下なら分割不要（末尾の改行は join では付かない）
+        if offsets[-1] - 1 <= CHUNK_THRESHOLD:
             return [Chunk(entries=transcripts, start_index=0, end_index=len(transcripts) - 1)]
 
         # 区切り位置を検出
-        boundaries = self._detect_boundaries(transcripts)
+        boundaries = self._detect_boundaries(transcripts, offsets)
 
         # 区切り位置でチャンクを作成
         chunks = []
@@ -126,22 +131,17 @@ class ChunkSplitter:
 
         return chunks if chunks else [Chunk(entries=transcripts, start_index=0, end_index=len(transcripts) - 1)]
 
-    def _detect_boundaries(self, transcripts: list[TranscriptEntry]) -> list[int]:
+    def _detect_boundaries(self, transcripts: list[TranscriptEntry], offsets: np.ndarray) -> list[int]:
         """話題の区切り位置を検出する."""
         boundaries = []
         window_start = 0
 
         while window_start < len(transcripts):
-            # ウィンドウ内のエントリを取得
-            window_entries = []
-            window_text_len = 0
-
-            for i in range(window_start, len(transcripts)):
-                entry_text = str(transcripts[i])
-                if window_text_len + len(entry_text) > BOUNDARY_DETECTION_MAX:
-                    break
-                window_entries.append(transcripts[i])
-                window_text_len += len(entry_text) + 1
+            # ウィンドウ内のエントリを取得（BOUNDARY_DETECTION_MAX に収まる範囲を二分探索）
+            limit = offsets[window_start] + BOUNDARY_DETECTION_MAX + 1
+            window_end = int(np.searchsorted(offsets, limit, side='right')) - 1
+            window_entries = transcripts[window_start:window_end]
+            window_text_len = int(offsets[window_end] - offsets[window_start])
 
             if not window_entries:
                 break
@@ -151,7 +151,7 @@ class ChunkSplitter:
                 break
 
             # 区切り位置を検出
-            window_text = '\n'.join(f'{window_start + i}: {e}' for i, e in enumerate(window_entries))
+            window_text = '\n'.join(f'{window_start + i}: {e.formatted}' for i, e in enumerate(window_entries))
             prompt = BOUNDARY_DETECTION_PROMPT.format(transcript=window_text)
 
             try:
@@ -207,20 +207,17 @@ class MapReduceGenerator:
         # チャンクに分割
         chunks = self.splitter.split(transcripts)
 
-        # 各チャンクから要点を抽出（Map）
-        points_list = []
-        for i, chunk in enumerate(chunks):
-            points = self._extract_points(chunk, i + 1, len(chunks))
-            points_list.append(points)
+        # 各チャンクから要点を抽出（Map）: 各チャンクは独立しているので並行に処理する
+        prompts = [EXTRACT_POINTS_PROMPT.format(transcript=chunk.to_text()) for chunk in chunks]
+        results = self.backend.generate_many(prompts)
+        points_list = [self._format_points(result, i + 1, len(chunks)) for i, result in enumerate(results)]
 
         # 要点を統合して議事録を生成（Reduce）
         return self._merge_points(points_list, template_text)
 
-    def _extract_points(self, chunk: Chunk, chunk_num: int, total_chunks: int) -> str:
-        """チャンクから要点を抽出する."""
-        prompt = EXTRACT_POINTS_PROMPT.format(transcript=chunk.to_text())
-
-        result = self.backend.generate(prompt)
+    @staticmethod
+    def _format_points(result: str, chunk_num: int, total_chunks: int) -> str:
+        """抽出結果にパート見出しを付ける."""
         return f'## パート {chunk_num}/{total_chunks}\n{result}'
 
     def _merge_points(self, points_list: list[str], template_text: str) -> str:
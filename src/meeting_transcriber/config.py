@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
+from dataclasses import replace
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
 import yaml
@@ -18,9 +21,14 @@ class TranscriptEntry:
     text: str
     index: int
 
-    def __str__(self) -> str:
+    @cached_property
+    def formatted(self) -> str:
+        """表示用の文字列（複数箇所から参照されるためキャッシュする）."""
         return f'[{self.timestamp.strftime("%H:%M:%S")}] {self.text}'
 
+    def __str__(self) -> str:
+        return self.formatted
+
 
 @dataclass
 class TemplateInfo:
@@ -127,27 +135,8 @@ class Config:
 
     def merge_args(self, **kwargs) -> Config:
         """コマンドライン引数をマージした新しいConfigを返す."""
-        data = {
-            'model_size': self.model_size,
-            'language': self.language,
-            'compute_device': self.compute_device,
-            'step_duration': self.step_duration,
-            'window_duration': self.window_duration,
-            'sample_rate': self.sample_rate,
-            'device_id': self.device_id,
-            'realtime_display': self.realtime_display,
-            'backend': self.backend,
-            'output_dir': self.output_dir,
-            'filename_format': self.filename_format,
-            'simple_output_dir': self.simple_output_dir,
-            'open_after': self.open_after,
-            'template': self.template,
-            'templates_dir': self.templates_dir,
-            'auto_update': self.auto_update,
-            'update_interval': self.update_interval,
-            'version_history': self.version_history,
-        }
-        for key, value in kwargs.items():
-            if value is not None:
-                data[key] = value
-        return Config(**data)
+        return replace(self, **{key: value for key, value in kwargs.items() if value is not None})
+
+
+# Configのフィールド名一覧（コマンドライン引数との対応付けに使う）
+CONFIG_FIELDS = frozenset(f.name for f in fields(Config))
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-import select
+import selectors
 import sys
 import termios
 import tty
@@ -18,6 +18,9 @@ class KeyboardHandler:
 
     def __init__(self) -> None:
         self._old_settings = None
+        # 標準入力の監視は一度だけ登録し、get_key の呼び出しごとに登録し直さない
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sys.stdin, selectors.EVENT_READ)
 
     @contextmanager
     def raw_mode(self) -> Generator[None, None, None]:
@@ -32,7 +35,7 @@ class KeyboardHandler:
 
     def get_key(self, timeout: float = 0.1) -> str | None:
         """非ブロッキングでキー入力を取得する."""
-        if select.select([sys.stdin], [], [], timeout)[0]:
+        if self._selector.select(timeout):
             char = sys.stdin.read(1)
             # Ctrl+C
             if char == '\x03':
@@ -43,6 +46,10 @@ class KeyboardHandler:
             return char
         return None
 
+    def close(self) -> None:
+        """標準入力の監視を終了する."""
+        self._selector.close()
+
     @staticmethod
     def print_help() -> None:
         """ヘルプを表示する."""
@@ -2,34 +2,66 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from datetime import timedelta
+import itertools
+import os
 from pathlib import Path
+import queue
 import subprocess
 import sys
 import threading
 import time
 
 from meeting_transcriber.audio import AudioRecorder
+from meeting_transcriber.audio import detach_chunk
+from meeting_transcriber.backends import Backend
 from meeting_transcriber.backends import get_backend
 from meeting_transcriber.config import Config
 from meeting_transcriber.config import TranscriptEntry
+from meeting_transcriber.keyboard import KeyboardHandler
 from meeting_transcriber.minutes import MinutesGenerator
 from meeting_transcriber.minutes import MinutesUpdater
 from meeting_transcriber.templates import TemplateManager
 from meeting_transcriber.transcriber import Transcriber
+from meeting_transcriber.transcript_store import TranscriptStore
+
+# 文字起こしの並列数の上限（ワーカーごとにモデルの推論状態を持つためメモリとのバランスで決める）
+MAX_WHISPER_WORKERS = 4
+# 1回のバッチ推論にまとめるチャンク数の上限と、追加のチャンクを待つ時間（秒）
+MAX_BATCH_CHUNKS = 8
+BATCH_COLLECT_TIMEOUT = 0.2
+# 直前の更新要求からこの時間（秒）内の自動更新は、その要求に含まれるものとして扱う
+UPDATE_DEBOUNCE_SECONDS = 2.0
 
 
 class MeetingTranscriber:
     """メインオーケストレータークラス."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, tui: bool = False) -> None:
         self.config = config
         self.start_time = datetime.now()
-        self.transcripts: list[TranscriptEntry] = []
-        self.transcript_index = 0
+        self._start_monotonic = time.monotonic()
+        self.transcripts = TranscriptStore()
+        # 通し番号の採番（結果回収スレッドのみが進める）
+        self._transcript_counter = itertools.count()
         self._running = False
         self._updating = False
-        self._lock = threading.Lock()
+        self._last_update_request = 0.0  # 直近の更新要求の時刻（time.monotonic）
+
+        # 文字起こしワーカープール（faster-whisperはGIL外で推論するため複数チャンクを並行処理できる）
+        # TUIは専用の1スレッドで文字起こしするので、モデルの並列数も1にして余分な推論状態を持たない
+        if tui:
+            self._whisper_workers = 1
+        else:
+            self._whisper_workers = max(1, min(MAX_WHISPER_WORKERS, (os.cpu_count() or 2) // 2))
+        self._whisper_pool = ThreadPoolExecutor(max_workers=self._whisper_workers, thread_name_prefix='whisper')
+        # 投入順に結果を回収するための未完了ジョブのキュー（チャンクの受信時刻と組にする）
+        self._pending_transcriptions: queue.Queue[tuple[Future[list[str]], list[datetime]]] = queue.Queue(
+            maxsize=self._whisper_workers * 2
+        )
 
         # テンプレートマネージャーの初期化
         self.template_manager = TemplateManager(config.templates_dir)
@@ -40,8 +72,13 @@ class MeetingTranscriber:
         if not self.template:
             raise RuntimeError(f'テンプレートが見つかりません: {config.template}')
 
-        # バックエンドの初期化
-        self.backend = get_backend(config)
+        # バックエンドの選択（CLI起動確認など）とWhisperモデルの読み込みは独立しているので並行に行う
+        # 設定の誤りはすぐに知らせたいので、バックエンドはこのスレッドで先に確認する。モデルの読み込みは
+        # デーモンスレッドで行い、バックエンドの初期化に失敗した場合は完了を待たずに終了できるようにする
+        model_future: Future[Transcriber] = Future()
+        threading.Thread(target=self._load_model_into, args=(model_future,), name='load-model', daemon=True).start()
+        self.backend = self._load_backend()
+        self.transcriber = model_future.result()
 
         # 各コンポーネントの初期化
         self.recorder = AudioRecorder(
@@ -51,12 +88,6 @@ class MeetingTranscriber:
             window_duration=config.window_duration,
         )
 
-        self.transcriber = Transcriber(
-            model_size=config.model_size,
-            language=config.language,
-            device=config.compute_device,
-        )
-
         self.generator = MinutesGenerator(self.backend, self.template_manager)
 
         output_dir = config.get_output_path()
@@ -70,6 +101,26 @@ class MeetingTranscriber:
             simple_mode=config.simple_output_dir is not None,
         )
 
+    def _load_backend(self) -> Backend:
+        """LLMバックエンドを初期化する."""
+        return get_backend(self.config)
+
+    def _load_model(self) -> Transcriber:
+        """Whisperモデルを読み込む."""
+        return Transcriber(
+            model_size=self.config.model_size,
+            language=self.config.language,
+            device=self.config.compute_device,
+            num_workers=self._whisper_workers,
+        )
+
+    def _load_model_into(self, future: Future[Transcriber]) -> None:
+        """Whisperモデルを読み込み、結果（または例外）を future に設定する."""
+        try:
+            future.set_result(self._load_model())
+        except BaseException as e:
+            future.set_exception(e)
+
     def run_tui(self) -> None:
         """TUIモードで実行する."""
         from meeting_transcriber.tui import MeetingTranscriberApp
@@ -80,9 +131,11 @@ class MeetingTranscriber:
             transcriber=self.transcriber,
             updater=self.updater,
             transcripts=self.transcripts,
-            lock=self._lock,
         )
-        result = app.run()
+        try:
+            result = app.run()
+        finally:
+            self.backend.close()
 
         # 終了後に出力先を表示
         if result is not None:
@@ -94,42 +147,97 @@ class MeetingTranscriber:
         pass
 
     def _transcribe_loop(self) -> None:
-        """文字起こしループ."""
-        while self._running:
-            audio = self.recorder.get_audio_chunk(timeout=0.5)
+        """文字起こしループ（音声チャンクをまとめてワーカープールに投入する）."""
+        while True:
+            # チャンクが届くまで待つ（終了時は _finalize が wake で起こし、残りのチャンクを投入してから抜ける）
+            audio = self.recorder.get_audio_chunk(timeout=None if self._running else 0)
             if audio is None:
+                if not self._running:
+                    break
                 continue
 
-            text = self.transcriber.transcribe(audio)
-            if text:
-                with self._lock:
-                    entry = TranscriptEntry(
-                        timestamp=datetime.now(),
-                        text=text,
-                        index=self.transcript_index,
-                    )
-                    self.transcripts.append(entry)
-                    self.transcript_index += 1
+            # チャンクはリングバッファのビューなので、投入前に int16 のコピーへ切り離す
+            # （float32 への変換は Transcriber が推論の直前に行う）
+            audios = [detach_chunk(audio)]
+            timestamps = [self._wall_clock()]
+
+            # 処理が追いつかずチャンクが溜まっている場合は、短時間だけ待って1回のバッチ推論にまとめる
+            deadline = time.monotonic() + BATCH_COLLECT_TIMEOUT
+            while len(audios) < MAX_BATCH_CHUNKS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                audio = self.recorder.get_audio_chunk(timeout=remaining)
+                if audio is None:
+                    break
+                audios.append(detach_chunk(audio))
+                timestamps.append(self._wall_clock())
+
+            # 未完了の文字起こしが溜まりすぎた場合は put がブロックし、古い音声はレコーダー側で破棄される
+            future = self._whisper_pool.submit(self.transcriber.transcribe_batch, audios)
+            self._pending_transcriptions.put((future, timestamps))
+
+    def _wall_clock(self) -> datetime:
+        """開始時刻 + 単調時計の経過時間で現在時刻を求める（チャンクごとに datetime.now() を呼ばない）."""
+        return self.start_time + timedelta(seconds=time.monotonic() - self._start_monotonic)
+
+    def _collect_loop(self) -> None:
+        """文字起こし結果を投入順に取り出して記録する."""
+        # 終了要求後も、文字起こしスレッドが投入を終えてキューが空になるまで回収を続ける
+        while self._running or self._transcribe_thread.is_alive() or not self._pending_transcriptions.empty():
+            try:
+                future, timestamps = self._pending_transcriptions.get(timeout=0.5)
+            except queue.Empty:
+                continue
 
-                    if self.config.realtime_display:
-                        print(f'\r{entry}')
+            # 1件の失敗で回収を止めると投入側がキュー満杯でブロックし続けるため、記録して次へ進む
+            try:
+                texts = future.result()
+            except Exception as e:
+                print(f'\r文字起こしに失敗しました: {e}')
+                continue
 
-    def _handle_update(self, full: bool = False) -> None:
-        """議事録更新を処理する."""
+            for text, timestamp in zip(texts, timestamps):
+                if not text:
+                    continue
+                entry = TranscriptEntry(
+                    timestamp=timestamp,
+                    text=text,
+                    index=next(self._transcript_counter),
+                )
+                self.transcripts.append(entry)
+
+                if self.config.realtime_display:
+                    print(f'\r{entry.formatted}')
+
+    def _handle_update(self, full: bool = False, auto: bool = False) -> None:
+        """議事録更新を処理する（auto=True は自動更新からの要求）."""
         if self._updating:
             print('\r更新中です...')
             return
 
-        with self._lock:
-            transcripts_copy = list(self.transcripts)
+        # 直前の要求と近すぎる自動更新は、その要求の結果に含まれるものとして無視する
+        # （キー操作による更新は利用者の明示的な要求なので間引かない）
+        now = time.monotonic()
+        if auto and now - self._last_update_request < UPDATE_DEBOUNCE_SECONDS:
+            return
+        self._last_update_request = now
 
-        if not transcripts_copy:
+        # 差分更新では前回更新以降の分だけ取り出す（退避済みの古いエントリを読み戻さない）
+        incremental = not full and self.updater.current_minutes
+        total = len(self.transcripts)
+        transcripts_copy = self.transcripts.tail(self.updater.last_update_index if incremental else 0)
+
+        if not total:
             print('\rまだ文字起こしがありません')
             return
+        if not transcripts_copy:
+            print('\r新しい文字起こしはありません')
+            return
 
         self._updating = True
         update_type = 'フル更新' if full else '差分更新'
-        new_count = len(transcripts_copy) - self.updater.last_update_index
+        new_count = total - self.updater.last_update_index
 
         print(f'\r議事録を{update_type}中... ({self.updater.update_count + 1}回目, 新規: {new_count}件)')
 
@@ -137,6 +245,7 @@ class MeetingTranscriber:
             try:
                 result = self.updater.update(transcripts_copy, full=full)
                 if result.success:
+                    self.transcripts.spill(self.updater.last_update_index)
                     elapsed = datetime.now() - self.start_time
                     print(
                         f'\r議事録を更新しました'
@@ -153,8 +262,7 @@ class MeetingTranscriber:
 
     def _handle_save(self) -> None:
         """文字起こしを保存する."""
-        with self._lock:
-            transcripts_copy = list(self.transcripts)
+        transcripts_copy = self.transcripts.tail(0)
 
         if not transcripts_copy:
             print('\rまだ文字起こしがありません')
@@ -201,14 +309,21 @@ class MeetingTranscriber:
         """メインループを実行する."""
         self._running = True
 
-        # 文字起こしスレッドを開始
-        transcribe_thread = threading.Thread(target=self._transcribe_loop, daemon=True)
-        transcribe_thread.start()
+        # 文字起こしスレッドと結果回収スレッドを開始
+        self._transcribe_thread = threading.Thread(target=self._transcribe_loop, daemon=True)
+        self._transcribe_thread.start()
+        self._collect_thread = threading.Thread(target=self._collect_loop, daemon=True)
+        self._collect_thread.start()
 
         # 録音を開始
         self.recorder.start(on_chunk=self._on_audio_chunk)
         self._print_header()
 
+        # 自動更新は次回の予定時刻（単調増加クロック）で判定し、取りこぼしや二重実行を防ぐ
+        interval = self.config.update_interval
+        next_auto_update = time.monotonic() + interval
+
+        self.keyboard = KeyboardHandler()
         try:
             with self.keyboard.raw_mode():
                 while self._running:
@@ -217,16 +332,15 @@ class MeetingTranscriber:
                         break
 
                     # 自動更新モード
-                    if self.config.auto_update:
-                        elapsed = (datetime.now() - self.start_time).total_seconds()
-                        if elapsed > 0 and int(elapsed) % self.config.update_interval == 0:
-                            if not self._updating:
-                                self._handle_update(full=False)
-                            time.sleep(1)
+                    if self.config.auto_update and time.monotonic() >= next_auto_update:
+                        if not self._updating:
+                            self._handle_update(full=False, auto=True)
+                        next_auto_update += interval
 
         except KeyboardInterrupt:
             pass
         finally:
+            self.keyboard.close()
             self._finalize()
 
     def _finalize(self) -> None:
@@ -234,11 +348,18 @@ class MeetingTranscriber:
         print('\n\n終了処理中...')
         self._running = False
         self.recorder.stop()
+        self.recorder.wake()
 
-        with self._lock:
-            transcripts_copy = list(self.transcripts)
+        # 録音停止時に出力された最後のチャンクまで投入・文字起こし・記録が終わるのを待つ
+        self._transcribe_thread.join()
+        self._whisper_pool.shutdown(wait=True)
+        self._collect_thread.join()
 
-        if transcripts_copy:
+        # 議事録がある場合は、反映・保存が済んでいない範囲だけを取り出す（退避済みの分を読み戻さない）
+        start = self.updater.first_unsaved_index() if self.updater.current_minutes else 0
+        transcripts_copy = self.transcripts.tail(start)
+
+        if self.transcripts:
             print('最終議事録を生成中...')
 
             # 最終更新
@@ -251,6 +372,7 @@ class MeetingTranscriber:
 
             # 保存
             path = self.updater.save(transcripts_copy)
+            self.updater.flush()
             print('完了しました')
             print(f'  出力: {path}')
 
@@ -260,12 +382,24 @@ class MeetingTranscriber:
         else:
             print('文字起こしがありませんでした')
 
+        self.backend.close()
+
     def _open_file(self, path: Path) -> None:
-        """ファイルを開く."""
+        """ファイルを開く.
+
+        ランチャーの終了を待たずに戻り、終了処理をブロックしない。
+        """
         try:
-            if sys.platform == 'linux':
-                subprocess.run(['xdg-open', str(path)], check=False)
+            if sys.platform == 'win32':
+                os.startfile(path)
+            elif sys.platform == 'linux':
+                subprocess.Popen(
+                    ['xdg-open', str(path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
             elif sys.platform == 'darwin':
-                subprocess.run(['open', str(path)], check=False)
+                subprocess.Popen(['open', str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception:
             pass
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+import os
 from pathlib import Path
+import queue
+import re
+import threading
 from typing import TYPE_CHECKING
 
 from meeting_transcriber.chunking import CHUNK_THRESHOLD
@@ -16,7 +20,8 @@ if TYPE_CHECKING:
     from meeting_transcriber.backends.base import Backend
     from meeting_transcriber.config import Template
 
-FULL_GENERATION_PROMPT = """あなたは議事録作成アシスタントです。
+# プロンプトは固定の指示部分（system）と可変部分に分け、バックエンドがプレフィックスキャッシュを使えるようにする
+FULL_GENERATION_SYSTEM_PROMPT = """あなたは議事録作成アシスタントです。
 以下の文字起こしテキストから、構造化された議事録を作成してください。
 
 【ルール】
@@ -25,8 +30,9 @@ FULL_GENERATION_PROMPT = """あなたは議事録作成アシスタントです
 - 決定事項やTODOを明確に抽出する
 - 発言者が特定できる場合は記載する
 - 時系列を意識して整理する
+"""
 
-【テンプレート】
+FULL_GENERATION_PROMPT = """【テンプレート】
 {template}
 
 【文字起こし】
@@ -36,7 +42,7 @@ FULL_GENERATION_PROMPT = """あなたは議事録作成アシスタントです
 テンプレートに沿った議事録をMarkdown形式で出力してください。
 """
 
-INCREMENTAL_UPDATE_PROMPT = """あなたは議事録作成アシスタントです。
+INCREMENTAL_UPDATE_SYSTEM_PROMPT = """あなたは議事録作成アシスタントです。
 既存の議事録に新しい発言内容を統合して、議事録を更新してください。
 
 【ルール】
@@ -45,8 +51,9 @@ INCREMENTAL_UPDATE_PROMPT = """あなたは議事録作成アシスタントで
 - 議論の流れが分かるように時系列を意識する
 - 決定事項やTODOが出たら該当セクションに追加
 - 全体の構成・フォーマットは維持する
+"""
 
-【現在の議事録】
+INCREMENTAL_UPDATE_PROMPT = """【現在の議事録】
 {current_minutes}
 
 【前回更新からの新しい発言】
@@ -56,6 +63,41 @@ INCREMENTAL_UPDATE_PROMPT = """あなたは議事録作成アシスタントで
 更新後の議事録全体をMarkdown形式で出力してください。
 """
 
+# 議事録がこの文字数を超えたら、前半を固定して要約のみを渡し、後半だけを差分更新する
+MAX_MINUTES_CHARS = 30_000
+# 議事録を分割する位置（Markdownの見出し行の先頭）
+HEADING_PATTERN = re.compile(r'^#{1,6} ', re.MULTILINE)
+# 決定事項・TODOなど、会議全体を通して追記され続けるセクションの見出し（前半として固定しない）
+COLLECTING_HEADING_PATTERN = re.compile(r'^#{1,6} [^\n]*(決定|合意|アクション|TODO|課題|次回|有望)', re.MULTILINE)
+
+HEAD_SUMMARY_SYSTEM_PROMPT = """あなたは議事録作成アシスタントです。
+議事録の前半部分を、後続の更新で参照するための要約にまとめてください。
+
+【ルール】
+- 議題、決定事項、TODO、未解決の論点を漏らさない
+- 箇条書きで簡潔にまとめる
+"""
+
+HEAD_SUMMARY_PROMPT = """【議事録の前半】
+{head}
+
+【出力】
+要約のみを出力してください。
+"""
+
+INCREMENTAL_WINDOW_PROMPT = """【議事録の前半（要約・変更不可）】
+{head_summary}
+
+【現在の議事録の後半】
+{current_minutes}
+
+【前回更新からの新しい発言】
+{new_transcripts}
+
+【出力】
+前半の内容を踏まえて、更新後の議事録の後半のみをMarkdown形式で出力してください。
+"""
+
 
 class MinutesGenerator:
     """議事録を生成するクラス."""
@@ -64,6 +106,8 @@ class MinutesGenerator:
         self.backend = backend
         self.template_manager = template_manager
         self._map_reduce_generator: MapReduceGenerator | None = None
+        # 固定した議事録の前半とその要約（フル生成で破棄する）
+        self._frozen_head: tuple[str, str] | None = None
 
     @property
     def map_reduce_generator(self) -> MapReduceGenerator:
@@ -79,7 +123,11 @@ class MinutesGenerator:
         context: dict,
     ) -> str:
         """文字起こし全体から議事録を生成する."""
-        transcript_text = '\n'.join(str(t) for t in transcripts)
+        # 議事録全体を作り直すので、差分更新用に固定していた前半は使えなくなる
+        self._frozen_head = None
+
+        # 結合した全文は保持せず、フル生成のたびに呼び出し元が読み戻したエントリから作る
+        transcript_text = '\n'.join(t.formatted for t in transcripts)
 
         # transcriptをコンテキストに追加してテンプレートをレンダリング
         render_context = {**context, 'transcript': transcript_text}
@@ -95,22 +143,76 @@ class MinutesGenerator:
             transcript=transcript_text,
         )
 
-        return self.backend.generate(prompt)
+        return self._generate(FULL_GENERATION_SYSTEM_PROMPT, prompt)
 
     def generate_incremental(
         self,
         current_minutes: str,
         new_transcripts: list[TranscriptEntry],
     ) -> str:
-        """差分から議事録を更新する."""
-        new_transcript_text = '\n'.join(str(t) for t in new_transcripts)
+        """差分から議事録を更新する.
+
+        議事録が MAX_MINUTES_CHARS を超えた場合は、見出し位置で前半を固定して要約のみを渡し、
+        後半だけを更新させる。プロンプトの長さが議事録全体の長さに比例して伸び続けないようにする。
+
+        決定事項・TODOなどの集約セクションが後から追記できるよう、固定する前半はそれらの見出しより前まで
+        （主に議論内容の古いトピック）に限る。その代わり、前半の基本情報や古いトピックへの追記はできず、
+        関連する発言は後半のトピックとして追加される。集約セクションの見出しがないテンプレートでは
+        前半に決定事項などが含まれることがあり、その場合は後半に同名の見出しが重複しうる。
+        """
+        new_transcript_text = '\n'.join(t.formatted for t in new_transcripts)
+
+        window = self._split_minutes(current_minutes)
+        if window is None:
+            prompt = INCREMENTAL_UPDATE_PROMPT.format(
+                current_minutes=current_minutes,
+                new_transcripts=new_transcript_text,
+            )
+            return self._generate(INCREMENTAL_UPDATE_SYSTEM_PROMPT, prompt)
 
-        prompt = INCREMENTAL_UPDATE_PROMPT.format(
-            current_minutes=current_minutes,
+        head, head_summary, tail = window
+        prompt = INCREMENTAL_WINDOW_PROMPT.format(
+            head_summary=head_summary,
+            current_minutes=tail,
             new_transcripts=new_transcript_text,
         )
-
-        return self.backend.generate(prompt)
+        updated_tail = self._generate(INCREMENTAL_UPDATE_SYSTEM_PROMPT, prompt)
+        return head + updated_tail.lstrip('\n')
+
+    def _split_minutes(self, minutes: str) -> tuple[str, str, str] | None:
+        """議事録を (固定する前半, 前半の要約, 更新する後半) に分ける。分けない場合はNone.
+
+        前半は一度固定したら、後半が再び上限を超えるまで同じ位置を使い、要約を作り直さない。
+        """
+        if self._frozen_head is not None:
+            head, summary = self._frozen_head
+            if minutes.startswith(head) and len(minutes) - len(head) <= MAX_MINUTES_CHARS:
+                return head, summary, minutes[len(head) :]
+
+        if len(minutes) <= MAX_MINUTES_CHARS:
+            return None
+
+        # 後半が上限の半分程度になる見出し位置で分割する（最初の集約セクションより後ろでは分割しない）
+        limit = len(minutes) - MAX_MINUTES_CHARS // 2
+        collecting = COLLECTING_HEADING_PATTERN.search(minutes)
+        if collecting is not None:
+            limit = min(limit, collecting.start())
+        split_at = 0
+        for match in HEADING_PATTERN.finditer(minutes):
+            if match.start() > limit:
+                break
+            split_at = match.start()
+        if split_at == 0:
+            return None
+
+        head = minutes[:split_at]
+        summary = self._generate(HEAD_SUMMARY_SYSTEM_PROMPT, HEAD_SUMMARY_PROMPT.format(head=head))
+        self._frozen_head = (head, summary)
+        return head, summary, minutes[split_at:]
+
+    def _generate(self, system: str, prompt: str) -> str:
+        """バックエンドで生成する（固定のsystemプロンプトはプレフィックスキャッシュに載せる）."""
+        return self.backend.generate_cached(system, prompt)
 
 
 class MinutesUpdater:
@@ -134,10 +236,21 @@ class MinutesUpdater:
         self.version_history = version_history
         self.simple_mode = simple_mode
 
+        # 更新タスクのみが書き換え、UIのタイマーなどからはロックなしで読む（int の代入・参照はアトミック）
         self.last_update_index = 0
         self.update_count = 0
         self.current_minutes = ''
 
+        # ファイル書き込みは専用スレッドで行い、更新処理をディスクI/Oで待たせない
+        self._writer_queue: queue.Queue[tuple[Path, str, bool]] = queue.Queue()
+        self._write_error: OSError | None = None
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+        # 文字起こしファイルは追記で保存する（_transcript_saved_index 件目まで書き込み依頼済み）
+        self._transcript_saved_index = 0
+        self._transcript_lock = threading.Lock()
+
         # 出力ディレクトリを作成
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -189,7 +302,7 @@ class MinutesUpdater:
                         success=True,
                         minutes=self.current_minutes,
                         new_entries_count=0,
-                        total_entries_count=len(transcripts),
+                        total_entries_count=self._end_index(transcripts),
                         update_number=self.update_count,
                     )
 
@@ -199,7 +312,7 @@ class MinutesUpdater:
                 )
                 new_entries_count = len(new_transcripts)
 
-            self.last_update_index = len(transcripts)
+            self.last_update_index = self._end_index(transcripts)
 
             # バージョン履歴を保存
             if self.version_history and not self.simple_mode:
@@ -209,7 +322,7 @@ class MinutesUpdater:
                 success=True,
                 minutes=self.current_minutes,
                 new_entries_count=new_entries_count,
-                total_entries_count=len(transcripts),
+                total_entries_count=self._end_index(transcripts),
                 update_number=self.update_count,
             )
 
@@ -219,7 +332,7 @@ class MinutesUpdater:
                 success=False,
                 minutes=self.current_minutes,
                 new_entries_count=0,
-                total_entries_count=len(transcripts),
+                total_entries_count=self._end_index(transcripts),
                 update_number=self.update_count,
                 error=str(e),
             )
@@ -228,8 +341,23 @@ class MinutesUpdater:
         self,
         transcripts: list[TranscriptEntry],
     ) -> list[TranscriptEntry]:
-        """前回更新以降の新しい文字起こしを取得する."""
-        return transcripts[self.last_update_index :]
+        """前回更新以降の新しい文字起こしを取得する.
+
+        transcripts は先頭からの全件でも、途中からの末尾部分でもよい（エントリの通し番号で判定する）。
+        """
+        if not transcripts:
+            return []
+        return transcripts[max(0, self.last_update_index - transcripts[0].index) :]
+
+    def first_unsaved_index(self) -> int:
+        """議事録への反映・文字起こしの保存のどちらかがまだの、最初のエントリの通し番号を返す."""
+        with self._transcript_lock:
+            return min(self.last_update_index, self._transcript_saved_index)
+
+    @staticmethod
+    def _end_index(transcripts: list[TranscriptEntry]) -> int:
+        """最後のエントリの次の通し番号（= 会議開始からの総件数）を返す."""
+        return transcripts[-1].index + 1 if transcripts else 0
 
     def save(self, transcripts: list[TranscriptEntry]) -> Path:
         """議事録と文字起こしを保存する."""
@@ -237,21 +365,19 @@ class MinutesUpdater:
             # シンプルモード: 単一ファイル
             filename = self.start_time.strftime(self.filename_format) + '.md'
             minutes_path = self.output_dir / filename
-            minutes_path.write_text(self.current_minutes, encoding='utf-8')
+            self._write_async(minutes_path, self.current_minutes)
             return minutes_path
 
         # 通常モード: セッションディレクトリ
         minutes_path = self.session_dir / 'minutes.md'
-        minutes_path.write_text(self.current_minutes, encoding='utf-8')
+        self._write_async(minutes_path, self.current_minutes)
 
         # 最終版を別名で保存
         final_path = self.session_dir / 'minutes_final.md'
-        final_path.write_text(self.current_minutes, encoding='utf-8')
+        self._write_async(final_path, self.current_minutes)
 
         # 生の文字起こしを保存
-        transcript_path = self.session_dir / 'transcript_raw.txt'
-        transcript_text = '\n'.join(str(t) for t in transcripts)
-        transcript_path.write_text(transcript_text, encoding='utf-8')
+        self._append_transcripts(self.session_dir / 'transcript_raw.txt', transcripts)
 
         return minutes_path
 
@@ -263,10 +389,25 @@ class MinutesUpdater:
         else:
             path = self.session_dir / 'transcript_raw.txt'
 
-        transcript_text = '\n'.join(str(t) for t in transcripts)
-        path.write_text(transcript_text, encoding='utf-8')
+        self._append_transcripts(path, transcripts)
         return path
 
+    def _append_transcripts(self, path: Path, transcripts: list[TranscriptEntry]) -> None:
+        """前回保存以降の文字起こしだけをファイルに追記する（初回は新規に書き込む）."""
+        with self._transcript_lock:
+            new_transcripts = transcripts
+            if transcripts:
+                new_transcripts = transcripts[max(0, self._transcript_saved_index - transcripts[0].index) :]
+            if not new_transcripts and self._transcript_saved_index:
+                return
+
+            text = '\n'.join(t.formatted for t in new_transcripts)
+            if self._transcript_saved_index:
+                self._write_async(path, '\n' + text, append=True)
+            else:
+                self._write_async(path, text)
+            self._transcript_saved_index = max(self._transcript_saved_index, self._end_index(transcripts))
+
     def get_current_minutes(self) -> str:
         """現在の議事録を取得する."""
         return self.current_minutes
@@ -274,4 +415,70 @@ class MinutesUpdater:
     def _save_version(self) -> None:
         """バージョン履歴を保存する."""
         version_path = self.session_dir / 'history' / f'minutes_v{self.update_count:03d}.md'
-        version_path.write_text(self.current_minutes, encoding='utf-8')
+        self._write_async(version_path, self.current_minutes)
+
+    def flush(self) -> None:
+        """書き込み待ちのファイルをすべて書き終えるまで待つ.
+
+        書き込みスレッドで発生したエラーがあれば、ここで送出する。
+        """
+        self._writer_queue.join()
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def _write_async(self, path: Path, content: str, append: bool = False) -> None:
+        """ファイル書き込みを書き込みスレッドに依頼する（append=True で末尾に追記）."""
+        self._writer_queue.put((path, content, append))
+
+    def _writer_loop(self) -> None:
+        """書き込み依頼を処理する.
+
+        同じパスへの連続した書き込みはまとめる（上書きは最新の内容のみ、追記は連結して1回で書く）。
+        """
+        while True:
+            items = [self._writer_queue.get()]
+            while True:
+                try:
+                    items.append(self._writer_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # dict は挿入順を保つので、パスごとにまとめた内容を依頼順に書く
+            pending: dict[Path, tuple[str, bool]] = {}
+            for path, content, append in items:
+                if append and path in pending:
+                    previous, previous_append = pending[path]
+                    pending[path] = (previous + content, previous_append)
+                else:
+                    pending[path] = (content, append)
+
+            for path, (content, append) in pending.items():
+                try:
+                    if append:
+                        self._write_append(path, content)
+                    else:
+                        self._write_atomic(path, content)
+                except OSError as e:
+                    self._write_error = e
+
+            for _ in items:
+                self._writer_queue.task_done()
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> None:
+        """一時ファイルに書いてから置き換え、書きかけのファイルが残らないようにする."""
+        tmp_path = path.with_name(path.name + '.tmp')
+        with tmp_path.open('wb') as f:
+            f.write(content.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_append(path: Path, content: str) -> None:
+        """ファイルの末尾に追記する."""
+        with path.open('ab') as f:
+            f.write(content.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
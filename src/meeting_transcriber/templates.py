@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+import hashlib
 from pathlib import Path
 import re
 
@@ -238,14 +239,72 @@ _この議事録はAIによって自動生成されました_
 }
 
 
+# ビルトインテンプレートの内容ハッシュ（インストール済みかどうかの判定に使う）
+BUILTIN_TEMPLATES_HASH = hashlib.blake2s(
+    '\0'.join(f'{name}\0{content}' for name, content in BUILTIN_TEMPLATES.items()).encode('utf-8')
+).hexdigest()
+INSTALLED_HASH_FILENAME = '.installed_hash'
+
+# YAMLフロントマターの抽出パターン
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+# テンプレート内のプレースホルダー（{{key}}）のパターン
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
+def _parse_template(name: str, content: str) -> tuple[TemplateInfo, str]:
+    """テンプレートのフロントマターをパースする."""
+    # YAMLフロントマターを抽出
+    match = FRONTMATTER_PATTERN.match(content)
+
+    if match:
+        frontmatter = yaml.safe_load(match.group(1)) or {}
+        template_content = match.group(2)
+    else:
+        frontmatter = {}
+        template_content = content
+
+    info = TemplateInfo(
+        name=name,
+        display_name=frontmatter.get('name', name),
+        description=frontmatter.get('description', ''),
+        tags=frontmatter.get('tags', []),
+    )
+
+    return info, template_content
+
+
+# ビルトインテンプレートはインポート時に一度だけパースしておく（内容が同じならYAMLを読み直さない）
+_PARSED_BUILTIN_TEMPLATES: dict[str, Template] = {
+    name: Template(*_parse_template(name, content)) for name, content in BUILTIN_TEMPLATES.items()
+}
+
+
 class TemplateManager:
     """テンプレートの管理を行うクラス."""
 
     def __init__(self, templates_dir: Path) -> None:
         self.templates_dir = templates_dir
+        # テンプレート名 -> (ファイルの更新時刻, パース済みテンプレート)
+        # ビルトインをファイルなしで使う場合は更新時刻を None として扱う
+        self._template_cache: dict[str, tuple[float | None, Template]] = {}
+        # テンプレート本文 -> プレースホルダーで分割した断片（偶数番目が固定文字列、奇数番目がキー）
+        self._parts_cache: dict[str, list[str]] = {}
 
     def install_builtin_templates(self) -> None:
-        """ビルトインテンプレートをインストールする."""
+        """ビルトインテンプレートをインストールする.
+
+        同じ内容のビルトインをインストール済みで、各ファイルも残っていれば、ハッシュファイルと
+        存在の確認のみで終了する（削除されたビルトインは再インストールする）。
+        """
+        hash_path = self.templates_dir / INSTALLED_HASH_FILENAME
+        try:
+            if hash_path.read_text(encoding='utf-8').strip() == BUILTIN_TEMPLATES_HASH and all(
+                (self.templates_dir / f'{name}.md').exists() for name in BUILTIN_TEMPLATES
+            ):
+                return
+        except OSError:
+            pass
+
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
         for name, content in BUILTIN_TEMPLATES.items():
@@ -254,6 +313,8 @@ class TemplateManager:
                 template_path.write_text(content, encoding='utf-8')
                 print(f'テンプレートをインストール: {name}')
 
+        hash_path.write_text(BUILTIN_TEMPLATES_HASH, encoding='utf-8')
+
     def list_templates(self) -> list[TemplateInfo]:
         """利用可能なテンプレート一覧を取得する."""
         templates = []
@@ -276,52 +337,51 @@ class TemplateManager:
         return templates
 
     def get_template(self, name: str) -> Template | None:
-        """テンプレートを取得する."""
-        # ファイルから読み込み
-        template_path = self.templates_dir / f'{name}.md'
-        if template_path.exists():
-            content = template_path.read_text(encoding='utf-8')
-        elif name in BUILTIN_TEMPLATES:
-            content = BUILTIN_TEMPLATES[name]
-        else:
-            return None
-
-        # フロントマターをパース
-        info, template_content = self._parse_template(name, content)
-        return Template(info=info, content=template_content)
-
-    def _parse_template(self, name: str, content: str) -> tuple[TemplateInfo, str]:
-        """テンプレートのフロントマターをパースする."""
-        # YAMLフロントマターを抽出
-        pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-        match = re.match(pattern, content, re.DOTALL)
+        """テンプレートを取得する.
 
-        if match:
-            frontmatter = yaml.safe_load(match.group(1)) or {}
-            template_content = match.group(2)
+        ファイルの更新時刻が変わっていなければ前回のパース結果を返す。
+        """
+        template_path = self.templates_dir / f'{name}.md'
+        try:
+            mtime: float | None = template_path.stat().st_mtime
+        except OSError:
+            if name not in BUILTIN_TEMPLATES:
+                return None
+            mtime = None
+
+        cached = self._template_cache.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # ファイルから読み込み（なければビルトイン）
+        content = template_path.read_text(encoding='utf-8') if mtime is not None else BUILTIN_TEMPLATES[name]
+
+        if content == BUILTIN_TEMPLATES.get(name):
+            # ビルトインと同じ内容ならパース済みのものを使う
+            template = _PARSED_BUILTIN_TEMPLATES[name]
         else:
-            frontmatter = {}
-            template_content = content
-
-        info = TemplateInfo(
-            name=name,
-            display_name=frontmatter.get('name', name),
-            description=frontmatter.get('description', ''),
-            tags=frontmatter.get('tags', []),
-        )
-
-        return info, template_content
+            # フロントマターをパース
+            info, template_content = _parse_template(name, content)
+            template = Template(info=info, content=template_content)
+        self._template_cache[name] = (mtime, template)
+        return template
 
     def render(self, template: Template, context: dict) -> str:
-        """テンプレートをレンダリングする."""
-        content = template.content
-
-        # プレースホルダーを置換
-        for key, value in context.items():
-            placeholder = '{{' + key + '}}'
-            content = content.replace(placeholder, str(value))
-
-        return content
+        """テンプレートをレンダリングする.
+
+        本文の分割結果はテンプレートごとにキャッシュし、更新のたびに正規表現で走査し直さない。
+        コンテキストにないプレースホルダーはそのまま残す。
+        """
+        parts = self._parts_cache.get(template.content)
+        if parts is None:
+            parts = PLACEHOLDER_PATTERN.split(template.content)
+            self._parts_cache[template.content] = parts
+
+        rendered = parts.copy()
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            rendered[i] = str(context[key]) if key in context else f'{{{{{key}}}}}'
+        return ''.join(rendered)
 
     @staticmethod
     def get_default_context(
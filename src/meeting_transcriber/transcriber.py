@@ -2,9 +2,31 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+
 from faster_whisper import WhisperModel
+from meeting_transcriber.audio import to_float32
 import numpy as np
 
+# 複数チャンクを1回の推論にまとめるバッチ推論（faster-whisper 1.1以降）
+try:
+    from faster_whisper import BatchedInferencePipeline
+    from faster_whisper.vad import VadOptions
+    from faster_whisper.vad import get_speech_timestamps
+except ImportError:
+    BatchedInferencePipeline = None
+
+# Whisperの入力サンプルレート
+WHISPER_SAMPLE_RATE = 16000
+# VADの設定（whisper.cpp: -vth 0.55 と同等）
+VAD_PARAMETERS = {
+    'threshold': 0.55,
+    'min_silence_duration_ms': 300,
+    'speech_pad_ms': 100,
+}
+# これ未満のRMS（float32換算）のチャンクは無音とみなし、Whisperを呼ばない（約 -60dBFS）
+SILENCE_RMS_THRESHOLD = 1e-3
+
 
 def _detect_cuda_available() -> bool:
     """CUDAが利用可能かどうかを検出する."""
@@ -35,6 +57,7 @@ class Transcriber:
         model_size: str = 'small',
         language: str = 'ja',
         device: str = 'auto',
+        num_workers: int = 1,  # 複数スレッドから同時に transcribe する場合の並列数
     ) -> None:
         self.model_size = model_size
         self.language = language
@@ -46,11 +69,28 @@ class Transcriber:
         compute_type = 'float16' if device == 'cuda' else 'int8'
 
         print(f'Whisperモデルを読み込み中... (model={model_size}, device={device}, compute_type={compute_type})')
-        self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        self.model = WhisperModel(model_size, device=device, compute_type=compute_type, num_workers=num_workers)
+        self.batched_model = BatchedInferencePipeline(model=self.model) if BatchedInferencePipeline else None
         print('Whisperモデルの読み込み完了')
 
     def transcribe(self, audio: np.ndarray) -> str:
-        """音声データを文字起こしする."""
+        """音声データを文字起こしする.
+
+        無音のチャンクは推論せずに空文字を返す。
+        """
+        # キャプチャは int16 なので、Whisperに渡す直前にのみ float32 へ変換する
+        audio = to_float32(audio)
+        if self._is_silent(audio):
+            return ''
+        return self._transcribe_one(audio)
+
+    @staticmethod
+    def _is_silent(audio: np.ndarray) -> bool:
+        """チャンクが無音（RMSがしきい値未満）かどうかを返す."""
+        return not len(audio) or float(np.sqrt(np.mean(np.square(audio)))) < SILENCE_RMS_THRESHOLD
+
+    def _transcribe_one(self, audio: np.ndarray) -> str:
+        """1チャンクをWhisperで文字起こしする."""
         # whisper.cppと同等の設定
         # language: None = auto, "ja" = 日本語固定
         lang = None if self.language == 'auto' else self.language
@@ -60,11 +100,7 @@ class Transcriber:
             language=lang,
             beam_size=5,  # デフォルト5、増やすと精度向上するが遅くなる
             vad_filter=True,
-            vad_parameters={
-                'threshold': 0.55,  # whisper.cpp: -vth 0.55
-                'min_silence_duration_ms': 300,
-                'speech_pad_ms': 100,
-            },
+            vad_parameters=VAD_PARAMETERS,
         )
 
         texts = []
@@ -74,3 +110,70 @@ class Transcriber:
                 texts.append(text)
 
         return ' '.join(texts)
+
+    def transcribe_batch(self, audios: list[np.ndarray]) -> list[str]:
+        """複数の音声チャンクをまとめて文字起こしする（結果は入力と同じ順序）.
+
+        無音のチャンクを除いた残りを推論する。
+        バッチ推論が使えない場合や残りが1件のみの場合はチャンクごとに推論する。
+        """
+        results = [''] * len(audios)
+        voiced: list[tuple[int, np.ndarray]] = []
+        for i, audio in enumerate(audios):
+            audio = to_float32(audio)
+            if not self._is_silent(audio):
+                voiced.append((i, audio))
+
+        if self.batched_model is None or len(voiced) <= 1:
+            texts = [self._transcribe_one(audio) for _, audio in voiced]
+        else:
+            texts = self._transcribe_batched([audio for _, audio in voiced])
+
+        for (i, _), text in zip(voiced, texts):
+            results[i] = text
+        return results
+
+    def _transcribe_batched(self, float_audios: list[np.ndarray]) -> list[str]:
+        """各チャンクの発話区間をVADで切り出して連結し、区間ごとを1件としてバッチ推論する."""
+        lang = None if self.language == 'auto' else self.language
+        vad_options = VadOptions(**VAD_PARAMETERS)
+
+        # チャンクごとに最初の発話開始から最後の発話終了までを1区間（最大でウィンドウ長）とする
+        # clip_timestampsは秒単位で渡す（VADの結果はサンプル単位）
+        clips = []
+        clip_owners = []  # 区間がどのチャンクのものか
+        offset = 0
+        for i, audio in enumerate(float_audios):
+            speech = get_speech_timestamps(audio, vad_options)
+            if speech:
+                clips.append(
+                    {
+                        'start': (offset + speech[0]['start']) / WHISPER_SAMPLE_RATE,
+                        'end': (offset + speech[-1]['end']) / WHISPER_SAMPLE_RATE,
+                    }
+                )
+                clip_owners.append(i)
+            offset += len(audio)
+
+        if not clips:
+            return ['' for _ in float_audios]
+
+        segments, _ = self.batched_model.transcribe(
+            np.concatenate(float_audios),
+            language=lang,
+            beam_size=5,
+            vad_filter=False,
+            clip_timestamps=clips,
+            batch_size=len(clips),
+        )
+
+        # セグメントの開始時刻から、どの区間（チャンク）の結果かを判定する
+        results: list[list[str]] = [[] for _ in float_audios]
+        clip_starts = [clip['start'] for clip in clips]
+        for segment in segments:
+            text = segment.text.strip()
+            if text:
+                clip_index = max(0, bisect_right(clip_starts, segment.start + 1e-3) - 1)
+                results[clip_owners[clip_index]].append(text)
+
+        return [' '.join(texts) for texts in results]
@@ -0,0 +1,118 @@
+"""文字起こしエントリの保持モジュール."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from itertools import islice
+import json
+import tempfile
+import threading
+from typing import TYPE_CHECKING
+
+from meeting_transcriber.config import TranscriptEntry
+
+if TYPE_CHECKING:
+    from typing import IO
+
+# メモリ上に保持するエントリ数の目安（これを超えた議事録反映済みのエントリはファイルへ退避する）
+MAX_IN_MEMORY_ENTRIES = 1000
+
+
+class TranscriptStore:
+    """文字起こしエントリを保持するクラス.
+
+    長時間の会議でもメモリ使用量が増え続けないよう、議事録に反映済みの古いエントリは
+    一時ファイル（NDJSON）へ退避する。インデックスは会議開始からの通し番号で扱い、
+    退避済みの範囲はフル更新や保存など全件が必要なときだけ読み戻す。
+
+    追加と読み出し（len / tail）はロックを取らない。メモリ上のエントリは deque で持ち、
+    append / popleft / copy がそれぞれGILの下でアトミックであることを利用する。
+    エントリの通し番号は 0 からの連番である前提で、位置はエントリ自身の index から求める。
+    """
+
+    def __init__(self, max_in_memory: int = MAX_IN_MEMORY_ENTRIES) -> None:
+        self.max_in_memory = max_in_memory
+        self._entries: deque[TranscriptEntry] = deque()
+        self._spilled = 0  # ファイルへ退避済みのエントリ数（退避のみが書き換える）
+        self._spill_file: IO[str] | None = None
+        self._file_lock = threading.Lock()  # 退避と退避ファイルの読み書きの排他
+
+    def __len__(self) -> int:
+        try:
+            return self._entries[-1].index + 1
+        except IndexError:
+            return self._spilled
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def append(self, entry: TranscriptEntry) -> None:
+        """エントリを追加する（退避中でも待たない）."""
+        self._entries.append(entry)
+
+    def tail(self, start: int = 0, stop: int | None = None) -> list[TranscriptEntry]:
+        """通し番号 start 以降（stop 指定時はその手前まで）のエントリを取得する.
+
+        退避済みの範囲を含む場合はファイルから読み戻す。
+        """
+        entries = self._entries.copy()
+        first = entries[0].index if entries else self._spilled
+        end = first + len(entries) if stop is None else stop
+        in_memory = list(islice(entries, max(0, start - first), max(0, end - first)))
+        if start >= first:
+            return in_memory
+        return self._load_spilled(start, min(end, first)) + in_memory
+
+    def spill(self, before: int) -> None:
+        """通し番号 before より前のエントリのうち、保持上限を超えた分をファイルへ退避する."""
+        with self._file_lock:
+            entries = self._entries.copy()
+            if not entries:
+                return
+            first = entries[0].index
+            count = min(len(entries) - self.max_in_memory, before - first)
+            if count <= 0:
+                return
+
+            lines = []
+            for entry in islice(entries, count):
+                record = {
+                    'timestamp': entry.timestamp.isoformat(),
+                    'text': entry.text,
+                    'index': entry.index,
+                    'formatted': entry.formatted,
+                }
+                lines.append(json.dumps(record, ensure_ascii=False) + '\n')
+
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+            self._spill_file.seek(0, 2)
+            self._spill_file.writelines(lines)
+            self._spill_file.flush()
+
+            # ファイルへの書き込みが終わってからメモリ上から外す（読み出し側が欠けた範囲を見ることはない）
+            for _ in range(count):
+                self._entries.popleft()
+            self._spilled = first + count
+
+    def _load_spilled(self, start: int, stop: int) -> list[TranscriptEntry]:
+        """退避済みのエントリのうち通し番号 start から stop の手前までを読み戻す."""
+        with self._file_lock:
+            if self._spill_file is None:
+                return []
+            self._spill_file.seek(0)
+            lines = list(islice(self._spill_file, start, stop))
+
+        entries = []
+        for line in lines:
+            record = json.loads(line)
+            entry = TranscriptEntry(
+                timestamp=datetime.fromisoformat(record['timestamp']),
+                text=record['text'],
+                index=record['index'],
+            )
+            # 退避時に整形済みの文字列も保存しているので、読み戻しで整形し直さない
+            entry.__dict__['formatted'] = record['formatted']
+            entries.append(entry)
+        return entries
@@ -2,27 +2,42 @@
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime
+from datetime import timedelta
+import itertools
 import threading
+import time
 from typing import TYPE_CHECKING
 
+from meeting_transcriber.config import TranscriptEntry
+from rich.markdown import Markdown
 from textual.app import App
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
-from textual.containers import VerticalScroll
 from textual.widgets import Footer
 from textual.widgets import Header
 from textual.widgets import Input
 from textual.widgets import RichLog
 from textual.widgets import Static
-from textual.worker import get_current_worker
 
 if TYPE_CHECKING:
     from meeting_transcriber.audio import AudioRecorder
     from meeting_transcriber.config import Config
     from meeting_transcriber.minutes import MinutesUpdater
     from meeting_transcriber.transcriber import Transcriber
+    from meeting_transcriber.transcript_store import TranscriptStore
+    from rich.console import RenderableType
+
+# 議事録がまだないときのプレビュー
+MINUTES_PLACEHOLDER = '[dim]議事録はまだ生成されていません。[u]キーで更新してください。[/dim]'
+# 議事録修正のプロンプト（指示・現在の議事録の前後に入る固定部分）
+CLAUDE_PROMPT_TEMPLATE = (
+    'あなたは議事録修正アシスタントです。\nユーザーの指示に従って議事録を修正してください。\n\n【ユーザーの指示】\n',
+    '\n\n【現在の議事録】\n',
+    '\n\n【出力】\n修正後の議事録全体をMarkdown形式で出力してください。余計な説明は不要です。',
+)
 
 
 class LogPanel(RichLog):
@@ -49,12 +64,15 @@ class TranscriptPanel(RichLog):
     """
 
 
-class MinutesPanel(Static):
-    """議事録プレビューパネル."""
+class MinutesPanel(RichLog):
+    """議事録プレビューパネル（RichLogは表示範囲の行だけを描画するため、長い議事録も全文を表示できる）."""
 
     DEFAULT_CSS = """
     MinutesPanel {
-        padding: 1;
+        height: 2fr;
+        border: solid white;
+        background: $surface;
+        padding: 0 1;
     }
     """
 
@@ -95,12 +113,6 @@ class MeetingTranscriberApp(App):
         height: 1fr;
     }
 
-    #minutes-scroll {
-        height: 2fr;
-        border: solid white;
-        background: $surface;
-    }
-
     .panel-title {
         text-style: bold;
         color: $text;
@@ -118,14 +130,28 @@ class MeetingTranscriberApp(App):
         Binding('c', 'focus_command', 'コマンド'),
     ]
 
+    # ログ・文字起こしパネルへの書き込みをまとめて反映する間隔（秒）と、1回で反映する最大行数
+    UI_FLUSH_INTERVAL = 0.05
+    UI_FLUSH_MAX_LINES = 256
+    # パネルに保持する最大行数（超えたら古い行から破棄する。文字起こしの全文はファイルに保存される）
+    LOG_PANEL_MAX_LINES = 500
+    TRANSCRIPT_PANEL_MAX_LINES = 5000
+    # ヘルプの表示内容（1件のログとしてまとめて書き込む）
+    HELP_LINES = (
+        '[dim]' + '─' * 30 + '[/dim]',
+        '[bold]操作方法:[/bold]',
+        '  [cyan]u[/cyan] 差分更新  [cyan]f[/cyan] フル更新  [cyan]s[/cyan] 保存',
+        '  [cyan]p[/cyan] 一時停止  [cyan]c[/cyan] コマンド入力  [cyan]q[/cyan] 終了',
+        '[dim]' + '─' * 30 + '[/dim]',
+    )
+
     def __init__(
         self,
         config: 'Config',
         recorder: 'AudioRecorder',
         transcriber: 'Transcriber',
         updater: 'MinutesUpdater',
-        transcripts: list,
-        lock: threading.Lock,
+        transcripts: 'TranscriptStore',
     ) -> None:
         super().__init__()
         self.config = config
@@ -133,23 +159,53 @@ class MeetingTranscriberApp(App):
         self.transcriber = transcriber
         self.updater = updater
         self.transcripts = transcripts
-        self.lock = lock
         self.start_time = datetime.now()
-        self.transcript_index = 0
-        self._running = True
-        self._updating = False
+        self._start_monotonic = time.monotonic()
+        # ログのタイムスタンプは秒単位なので、同じ秒のあいだは整形済みの文字列を使い回す
+        self._log_ts_second = -1
+        self._log_ts = ''
+        # 書き込み待ちの最後のログ（メッセージ, 書き込む行）と、同じメッセージが続いた回数
+        # 同じタイマー間隔内で続いた同一メッセージは、最後の行に (xN) を付けて1行にまとめる
+        self._last_log: tuple[str, str] | None = None
+        self._log_repeats = 1
+        # ログのキュー・直前のログ・タイムスタンプのキャッシュはワーカーとタイマーの両方から触るため保護する
+        self._log_lock = threading.Lock()
+        # 通し番号の採番（文字起こしワーカーのみが進める）
+        self._transcript_counter = itertools.count()
+        # 終了要求（文字起こしワーカーの停止に使う）
+        self._stop_event = threading.Event()
+        # 議事録の更新・修正は同時に1つだけ（取得できた側だけが処理を開始し、完了時に解放する）
+        self._updating_lock = threading.Lock()
+        # 処理中に入力されたClaudeへの指示（完了後に1回の依頼にまとめて送信する）
+        self._pending_instructions: deque[str] = deque()
+        # パネルへの書き込み待ちの行（どのスレッドからも追加でき、タイマーでまとめて書き込む）
+        # 文字起こしは deque の append/popleft がアトミックなのでロックを取らない（ログは _log_lock で保護）
+        self._log_queue: deque[str] = deque()
+        self._tx_queue: deque[str] = deque()
+        self._last_preview: str | None = None  # 議事録プレビューに最後に表示した内容
+        # ステータスバーに表示する状態（変更はフラグだけ立て、タイマーで1回だけ再描画する）
+        self._pending_status = ''
+        self._status_dirty = False
+        self._status_text = ''  # ステータスバーに最後に表示した内容
 
     def compose(self) -> ComposeResult:
         """UIを構成する."""
         yield Header()
         with Vertical(id='main-container'):
             yield Static('[ Log ]', classes='panel-title')
-            yield LogPanel(id='log-panel', highlight=True, markup=True, auto_scroll=True)
+            yield LogPanel(
+                id='log-panel', highlight=True, markup=True, auto_scroll=True, max_lines=self.LOG_PANEL_MAX_LINES
+            )
             yield Static('[ Transcript ]', classes='panel-title')
-            yield TranscriptPanel(id='transcript-panel', highlight=True, markup=True, auto_scroll=True)
+            yield TranscriptPanel(
+                id='transcript-panel',
+                highlight=True,
+                markup=True,
+                auto_scroll=True,
+                max_lines=self.TRANSCRIPT_PANEL_MAX_LINES,
+            )
             yield Static('[ Minutes Preview ]', classes='panel-title')
-            with VerticalScroll(id='minutes-scroll'):
-                yield MinutesPanel(id='minutes-panel')
+            yield MinutesPanel(id='minutes-panel', markup=True, wrap=True, auto_scroll=False)
             yield Static('[ Claude Command ]', classes='panel-title')
             yield CommandInput(id='command-input', placeholder='議事録への指示を入力...')
         yield StatusBar(id='status-bar')
@@ -160,6 +216,15 @@ class MeetingTranscriberApp(App):
         self.title = 'Meeting Transcriber'
         self.sub_title = f'Model: {self.config.model_size} | Device: {self.config.compute_device}'
 
+        # 更新のたびにセレクタでDOMを探さないよう、ウィジェットの参照を保持しておく
+        self._log_panel = self.query_one('#log-panel', LogPanel)
+        self._tx_panel = self.query_one('#transcript-panel', TranscriptPanel)
+        self._minutes_panel = self.query_one('#minutes-panel', MinutesPanel)
+        self._status_bar = self.query_one('#status-bar', StatusBar)
+        self._command_input = self.query_one('#command-input', CommandInput)
+
+        self.set_interval(self.UI_FLUSH_INTERVAL, self._flush_ui_buffers)
+
         self.log_message('[green]録音開始...[/green]')
         self.log_message(f'ステップ: {self.config.step_duration}秒 | ウィンドウ: {self.config.window_duration}秒')
         if self.config.auto_update:
@@ -169,8 +234,9 @@ class MeetingTranscriberApp(App):
         # 録音開始
         self.recorder.start()
 
-        # 文字起こしワーカーを開始（スレッドで実行）
-        self.run_worker(self.transcribe_worker, exclusive=True, thread=True)
+        # 文字起こしワーカーを開始（更新・Claude呼び出しのワーカーと共有しない専用スレッドで実行）
+        self._tx_thread = threading.Thread(target=self.transcribe_worker, name='transcribe', daemon=True)
+        self._tx_thread.start()
 
         # 自動更新タイマーを開始
         if self.config.auto_update:
@@ -178,12 +244,11 @@ class MeetingTranscriberApp(App):
 
     def _auto_update(self) -> None:
         """自動更新を実行する."""
-        if self._updating or self.recorder.is_paused():
+        if self._updating_lock.locked() or self.recorder.is_paused():
             return
 
-        with self.lock:
-            transcript_count = len(self.transcripts)
-            new_count = transcript_count - self.updater.last_update_index
+        transcript_count = len(self.transcripts)
+        new_count = transcript_count - self.updater.last_update_index
 
         # 新しい発言がなければスキップ
         if new_count == 0:
@@ -193,67 +258,121 @@ class MeetingTranscriberApp(App):
         self._do_update(full=False)
 
     def transcribe_worker(self) -> None:
-        """文字起こしワーカー（スレッドプールで実行）."""
-        worker = get_current_worker()
-
-        while self._running and not worker.is_cancelled:
-            audio = self.recorder.get_audio_chunk(timeout=0.5)
+        """文字起こしワーカー（専用スレッドで実行し、終了要求で停止する）."""
+        while not self._stop_event.is_set():
+            # チャンクが届くまで待つ（一時停止中も含め、終了時は action_quit が wake で起こす）
+            audio = self.recorder.get_audio_chunk(timeout=None)
             if audio is None:
                 continue
 
             text = self.transcriber.transcribe(audio)
             if text:
-                timestamp = datetime.now()
-
-                # TranscriptEntryを作成
-                from meeting_transcriber.config import TranscriptEntry
-
                 entry = TranscriptEntry(
-                    timestamp=timestamp,
+                    timestamp=self._wall_clock(),
                     text=text,
-                    index=self.transcript_index,
+                    index=next(self._transcript_counter),
                 )
+                self.transcripts.append(entry)
 
-                with self.lock:
-                    self.transcripts.append(entry)
-                    self.transcript_index += 1
+                # UIを更新（バッファに積むだけなのでワーカースレッドから直接呼べる）
+                self.add_transcript(entry.formatted)
 
-                # UIを更新
-                self.call_from_thread(self.add_transcript, str(entry))
+    def _wall_clock(self) -> datetime:
+        """開始時刻 + 単調時計の経過時間で現在時刻を求める（発言ごとに datetime.now() を呼ばない）."""
+        return self.start_time + timedelta(seconds=time.monotonic() - self._start_monotonic)
 
     def add_transcript(self, text: str) -> None:
-        """文字起こしを追加する."""
-        panel = self.query_one('#transcript-panel', TranscriptPanel)
-        panel.write(text)
+        """文字起こしを追加する（どのスレッドからでも呼べる）."""
+        self._tx_queue.append(text)
 
     def log_message(self, message: str) -> None:
-        """ログメッセージを追加する."""
-        panel = self.query_one('#log-panel', LogPanel)
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        panel.write(f'[dim]{timestamp}[/dim] {message}')
-        panel.refresh()
+        """ログメッセージを追加する（どのスレッドからでも呼べる）."""
+        with self._log_lock:
+            # まだ書き込まれていない直前の行と同じメッセージなら、その行に回数を付ける
+            if self._last_log is not None and self._last_log[0] == message and self._log_queue:
+                self._log_repeats += 1
+                self._log_queue[-1] = f'{self._last_log[1]} [dim](x{self._log_repeats})[/dim]'
+                return
+
+            line = f'[dim]{self._log_timestamp()}[/dim] {message}'
+            self._last_log = (message, line)
+            self._log_repeats = 1
+            self._log_queue.append(line)
+
+    def _log_timestamp(self) -> str:
+        """ログ用の現在時刻（HH:MM:SS）を返す（_log_lock 内で呼び出す）."""
+        now = int(time.time())
+        if now != self._log_ts_second:
+            lt = time.localtime(now)
+            self._log_ts = f'{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}'
+            self._log_ts_second = now
+        return self._log_ts
+
+    def _flush_ui_buffers(self) -> None:
+        """書き込み待ちの行をパネルごとに1回の書き込みで反映する."""
+        with self._log_lock:
+            log_lines = self._drain(self._log_queue)
+            # 書き込んだ行は変更できないので、まとめるのは同じタイマー間隔内に続いたものだけにする
+            self._last_log = None
+        if log_lines:
+            self._log_panel.write('\n'.join(log_lines))
+        tx_lines = self._drain(self._tx_queue)
+        if tx_lines:
+            self._tx_panel.write('\n'.join(tx_lines))
+        if self._status_dirty:
+            self._status_dirty = False
+            self._render_status_bar(self._pending_status)
+
+    def _drain(self, lines: deque[str]) -> list[str]:
+        """キューから最大 UI_FLUSH_MAX_LINES 行を取り出す（残りは次回のタイマーで反映する）."""
+        drained = []
+        while lines and len(drained) < self.UI_FLUSH_MAX_LINES:
+            drained.append(lines.popleft())
+        return drained
 
     def update_status(self, status: str) -> None:
-        """ステータスバーを更新する."""
-        elapsed = datetime.now() - self.start_time
-        elapsed_str = str(elapsed).split('.')[0]
+        """ステータスバーの更新を予約する（どのスレッドからでも呼べる）."""
+        self._pending_status = status
+        self._status_dirty = True
+
+    def _render_status_bar(self, status: str) -> None:
+        """ステータスバーを再描画する."""
+        # str(timedelta) と同じ H:MM:SS 形式を整数演算で作る
+        secs = int(time.monotonic() - self._start_monotonic)
+        elapsed_str = f'{secs // 3600}:{secs % 3600 // 60:02d}:{secs % 60:02d}'
 
-        with self.lock:
-            transcript_count = len(self.transcripts)
+        transcript_count = len(self.transcripts)
 
-        bar = self.query_one('#status-bar', StatusBar)
         update_count = self.updater.update_count
-        bar.update(f'{status} | 経過: {elapsed_str} | 発言: {transcript_count}件 | 更新: {update_count}回')
+        text = f'{status} | 経過: {elapsed_str} | 発言: {transcript_count}件 | 更新: {update_count}回'
 
-    def update_minutes_preview(self) -> None:
-        """議事録プレビューを更新する."""
-        panel = self.query_one('#minutes-panel', MinutesPanel)
+        # 表示中と同じ内容ならウィジェットを更新しない（Static.update は再レイアウトを伴う）
+        if text == self._status_text:
+            return
+        self._status_text = text
+        self._status_bar.update(text)
+
+    def _prepare_minutes_preview(self) -> tuple[str, RenderableType] | None:
+        """議事録プレビューの表示内容を組み立てる（Markdownの解析を伴うため、ワーカースレッドで呼ぶ）.
+
+        表示中の内容から変わっていなければNone。
+        """
         minutes = self.updater.get_current_minutes()
-        if minutes:
-            # Markdownを簡易表示
-            panel.update(minutes[:2000] + ('...' if len(minutes) > 2000 else ''))
-        else:
-            panel.update('[dim]議事録はまだ生成されていません。[u]キーで更新してください。[/dim]')
+        if not minutes:
+            return MINUTES_PLACEHOLDER, MINUTES_PLACEHOLDER
+        if minutes == self._last_preview:
+            return None
+        return minutes, Markdown(minutes)
+
+    def update_minutes_preview(self, preview: str, renderable: RenderableType) -> None:
+        """議事録プレビューを更新する（組み立て済みの内容を書き込むだけ）."""
+        # 内容が変わっていなければ再描画しない
+        if preview == self._last_preview:
+            return
+        self._last_preview = preview
+
+        self._minutes_panel.clear()
+        self._minutes_panel.write(renderable)
 
     def action_update_minutes(self) -> None:
         """議事録を差分更新する."""
@@ -265,52 +384,65 @@ class MeetingTranscriberApp(App):
 
     def _do_update(self, full: bool = False) -> None:
         """議事録を更新する."""
-        if self._updating:
+        if not self._updating_lock.acquire(blocking=False):
             self.log_message('[yellow]更新中です...[/yellow]')
             return
 
-        with self.lock:
-            transcripts_copy = list(self.transcripts)
+        # ここでは件数だけを確定し、エントリの取り出しは更新スレッドで行う（UIスレッドでコピーしない）
+        # 差分更新では前回更新以降の分だけ取り出す（退避済みの古いエントリを読み戻さない）
+        incremental = bool(not full and self.updater.current_minutes)
+        total = len(self.transcripts)
+        new_count = total - self.updater.last_update_index
 
-        if not transcripts_copy:
+        if not total:
+            self._updating_lock.release()
             self.log_message('[yellow]まだ文字起こしがありません[/yellow]')
             return
+        if incremental and new_count <= 0:
+            self._updating_lock.release()
+            self.log_message('[yellow]新しい文字起こしはありません[/yellow]')
+            return
 
-        self._updating = True
         update_type = 'フル更新' if full else '差分更新'
-        new_count = len(transcripts_copy) - self.updater.last_update_index
+        start = self.updater.last_update_index if incremental else 0
 
         self.log_message(f'[cyan]{update_type}中... ({self.updater.update_count + 1}回目, 新規: {new_count}件)[/cyan]')
         self.update_status(f'{update_type}中...')
 
         # バックグラウンドで更新（スレッドで実行）
-        self.run_worker(lambda: self._update_task(transcripts_copy, full), exclusive=False, thread=True)
+        self.run_worker(lambda: self._update_task(start, total, full), exclusive=False, thread=True)
 
-    def _update_task(self, transcripts: list, full: bool) -> None:
-        """更新タスク（スレッドプールで実行）."""
+    def _update_task(self, start: int, stop: int, full: bool) -> None:
+        """更新タスク（スレッドプールで実行）.
+
+        通し番号 start から stop の手前までのエントリを反映する。
+        """
         try:
-            result = self.updater.update(transcripts, full=full)
+            result = self.updater.update(self.transcripts.tail(start, stop), full=full)
             if result.success:
+                self.transcripts.spill(self.updater.last_update_index)
                 count = result.new_entries_count
-                self.call_from_thread(self.log_message, f'[green]更新完了 | 新規: {count}件[/green]')
-                self.call_from_thread(self.update_minutes_preview)
+                self.log_message(f'[green]更新完了 | 新規: {count}件[/green]')
+                preview = self._prepare_minutes_preview()
+                if preview is not None:
+                    self.call_from_thread(self.update_minutes_preview, *preview)
             else:
-                self.call_from_thread(self.log_message, f'[red]更新失敗: {result.error}[/red]')
+                self.log_message(f'[red]更新失敗: {result.error}[/red]')
         finally:
-            self._updating = False
-            self.call_from_thread(self.update_status, '録音中')
+            self._updating_lock.release()
+            self.update_status('録音中')
+            # 処理中に届いた指示があれば続けて送信する
+            if self._pending_instructions:
+                self.call_from_thread(self._dispatch_pending_instructions)
 
     def action_save(self) -> None:
         """文字起こしを保存する."""
-        with self.lock:
-            transcripts_copy = list(self.transcripts)
-
-        if not transcripts_copy:
+        if not self.transcripts:
             self.log_message('[yellow]まだ文字起こしがありません[/yellow]')
             return
 
         try:
-            path = self.updater.save_transcript_only(transcripts_copy)
+            path = self.updater.save_transcript_only(self.transcripts.tail(0))
             self.log_message(f'[green]保存しました: {path}[/green]')
         except Exception as e:
             self.log_message(f'[red]保存エラー: {e}[/red]')
@@ -328,28 +460,26 @@ class MeetingTranscriberApp(App):
 
     def action_help(self) -> None:
         """ヘルプを表示する."""
-        self.log_message('[dim]─[/dim]' * 30)
-        self.log_message('[bold]操作方法:[/bold]')
-        self.log_message('  [cyan]u[/cyan] 差分更新  [cyan]f[/cyan] フル更新  [cyan]s[/cyan] 保存')
-        self.log_message('  [cyan]p[/cyan] 一時停止  [cyan]c[/cyan] コマンド入力  [cyan]q[/cyan] 終了')
-        self.log_message('[dim]─[/dim]' * 30)
+        self.log_message('\n'.join(self.HELP_LINES))
 
     def action_focus_command(self) -> None:
         """コマンド入力欄にフォーカスする."""
-        self.query_one('#command-input', CommandInput).focus()
+        self._command_input.focus()
 
     def action_quit(self) -> None:
         """アプリケーションを終了する."""
-        self._running = False
+        self._stop_event.set()
 
-        # 録音停止
+        # 録音停止（待機中の文字起こしワーカーも起こす）
         self.recorder.stop()
+        self.recorder.wake()
 
-        with self.lock:
-            transcripts_copy = list(self.transcripts)
+        # 議事録がある場合は、反映・保存が済んでいない範囲だけを取り出す（退避済みの分を読み戻さない）
+        start = self.updater.first_unsaved_index() if self.updater.current_minutes else 0
+        transcripts_copy = self.transcripts.tail(start)
 
         output_path = None
-        if transcripts_copy:
+        if self.transcripts:
             # 最終更新
             if not self.updater.current_minutes:
                 self.updater.update(transcripts_copy, full=True)
@@ -360,6 +490,7 @@ class MeetingTranscriberApp(App):
 
             # 保存
             output_path = self.updater.save(transcripts_copy)
+            self.updater.flush()
 
         # 終了（出力パスを返す）
         self.exit(output_path)
@@ -381,31 +512,47 @@ class MeetingTranscriberApp(App):
             self.log_message('[yellow]議事録がまだ生成されていません。先に[u]キーで更新してください。[/yellow]')
             return
 
-        # 更新中なら待つ
-        if self._updating:
-            self.log_message('[yellow]更新中です。完了をお待ちください。[/yellow]')
+        # 先にキューへ積んでから送信を試みる（処理中なら、完了した側がまとめて送信する）
+        self._pending_instructions.append(command)
+        if self._updating_lock.locked():
+            self.log_message(f'[dim]処理中のため、完了後にまとめて送信します: {command}[/dim]')
             return
+        self._dispatch_pending_instructions()
 
-        self._updating = True
-        self.log_message(f'[magenta]指示を送信中: {command}[/magenta]')
-        self.update_status('Claude処理中...')
-
-        # バックグラウンドで処理
-        self.run_worker(lambda: self._send_to_claude(command), exclusive=False, thread=True)
+    def _dispatch_pending_instructions(self) -> None:
+        """キューに溜まった指示を1回の依頼にまとめてClaudeに送信する（イベントループで実行）."""
+        if not self._pending_instructions or not self._updating_lock.acquire(blocking=False):
+            return
 
-    def _send_to_claude(self, instruction: str) -> None:
-        """Claudeに指示を送信して議事録を修正する."""
-        prompt = f"""あなたは議事録修正アシスタントです。
-ユーザーの指示に従って議事録を修正してください。
+        instructions = []
+        while self._pending_instructions:
+            instructions.append(self._pending_instructions.popleft())
+        instruction = instructions[0] if len(instructions) == 1 else '\n'.join(f'- {i}' for i in instructions)
 
-【ユーザーの指示】
-{instruction}
+        # ロック取得後に参照するので、処理中に他の更新で書き換わることはない
+        minutes = self.updater.current_minutes
 
-【現在の議事録】
-{self.updater.current_minutes}
+        self.log_message(f'[magenta]指示を送信中: {" / ".join(instructions)}[/magenta]')
+        self.update_status('Claude処理中...')
 
-【出力】
-修正後の議事録全体をMarkdown形式で出力してください。余計な説明は不要です。"""
+        # バックグラウンドで処理
+        self.run_worker(lambda: self._send_to_claude(instruction, minutes), exclusive=False, thread=True)
+
+    def _send_to_claude(self, instruction: str, minutes: str) -> None:
+        """Claudeに指示を送信して議事録を修正する.
+
+        minutes は送信時点の議事録（更新ロックを取得した状態で渡されるため、処理中に書き換わらない）。
+        """
+        # 固定部分は定数として持ち、議事録全体の書式解析・中間文字列の生成を1回の連結に抑える
+        prompt = ''.join(
+            (
+                CLAUDE_PROMPT_TEMPLATE[0],
+                instruction,
+                CLAUDE_PROMPT_TEMPLATE[1],
+                minutes,
+                CLAUDE_PROMPT_TEMPLATE[2],
+            )
+        )
 
         try:
             # バックエンドで生成
@@ -413,10 +560,15 @@ class MeetingTranscriberApp(App):
 
             # 結果を反映
             self.updater.current_minutes = result
-            self.call_from_thread(self.update_minutes_preview)
-            self.call_from_thread(self.log_message, '[green]議事録を修正しました[/green]')
+            preview = self._prepare_minutes_preview()
+            if preview is not None:
+                self.call_from_thread(self.update_minutes_preview, *preview)
+            self.log_message('[green]議事録を修正しました[/green]')
         except Exception as e:
-            self.call_from_thread(self.log_message, f'[red]エラー: {e}[/red]')
+            self.log_message(f'[red]エラー: {e}[/red]')
         finally:
-            self._updating = False
-            self.call_from_thread(self.update_status, '録音中')
+            self._updating_lock.release()
+            self.update_status('録音中')
+            # 処理中に届いた指示があれば続けて送信する
+            if self._pending_instructions:
+                self.call_from_thread(self._dispatch_pending_instructions)
@@ -0,0 +1,75 @@
+"""Transcriberのバッチ推論のテスト."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from meeting_transcriber import transcriber
+from meeting_transcriber.transcriber import Transcriber
+from meeting_transcriber.transcriber import WHISPER_SAMPLE_RATE
+import numpy as np
+import pytest
+
+# テスト用チャンクの長さ（2秒）
+CHUNK_SAMPLES = 2 * WHISPER_SAMPLE_RATE
+
+
+class FakeBatchedModel:
+    """clip_timestampsの区間ごとに1セグメントを返す偽のバッチ推論パイプライン."""
+
+    def __init__(self) -> None:
+        self.clip_timestamps: list[dict] = []
+
+    def transcribe(self, audio: np.ndarray, clip_timestamps: list[dict], **kwargs) -> tuple:
+        # faster-whisper 1.2 と同じく clip_timestamps を秒として解釈する
+        duration = len(audio) / WHISPER_SAMPLE_RATE
+        self.clip_timestamps = clip_timestamps
+        segments = []
+        for n, clip in enumerate(clip_timestamps):
+            assert 0 <= clip['start'] < clip['end'] <= duration
+            segments.append(SimpleNamespace(start=clip['start'], end=clip['end'], text=f' clip{n} '))
+        return iter(segments), None
+
+
+def _fake_speech_timestamps(audio: np.ndarray, vad_options: object) -> list[dict]:
+    """非ゼロのサンプル範囲を発話区間（サンプル単位）として返す."""
+    voiced = np.flatnonzero(audio)
+    if not len(voiced):
+        return []
+    return [{'start': int(voiced[0]), 'end': int(voiced[-1]) + 1}]
+
+
+def _voiced_chunk(start: float, end: float) -> np.ndarray:
+    """start〜end秒だけ音がある float32 のチャンクを作る."""
+    audio = np.zeros(CHUNK_SAMPLES, dtype=np.float32)
+    audio[int(start * WHISPER_SAMPLE_RATE) : int(end * WHISPER_SAMPLE_RATE)] = 0.1
+    return audio
+
+
+@pytest.fixture
+def batched_transcriber(monkeypatch: pytest.MonkeyPatch) -> Transcriber:
+    """モデルを読み込まずに偽のバッチ推論を持つTranscriberを作る."""
+    monkeypatch.setattr(transcriber, 'get_speech_timestamps', _fake_speech_timestamps, raising=False)
+    monkeypatch.setattr(transcriber, 'VadOptions', lambda **kwargs: None, raising=False)
+    instance = Transcriber.__new__(Transcriber)
+    instance.language = 'ja'
+    instance.model = None
+    instance.batched_model = FakeBatchedModel()
+    return instance
+
+
+def test_transcribe_batch_maps_clips_to_chunks(batched_transcriber: Transcriber) -> None:
+    audios = [
+        _voiced_chunk(0.5, 1.5),
+        np.zeros(CHUNK_SAMPLES, dtype=np.float32),  # 無音はバッチから除外される
+        _voiced_chunk(1.0, 2.0),
+    ]
+
+    results = batched_transcriber.transcribe_batch(audios)
+
+    # 区間は秒単位で、連結後の音声上の位置になっている
+    assert batched_transcriber.batched_model.clip_timestamps == [
+        {'start': 0.5, 'end': 1.5},
+        {'start': 3.0, 'end': 4.0},
+    ]
+    assert results == ['clip0', '', 'clip1']
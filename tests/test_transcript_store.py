@@ -0,0 +1,155 @@
+"""TranscriptStoreの退避（spill）と読み戻しのテスト."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from datetime import timedelta
+import threading
+from typing import TYPE_CHECKING
+
+from meeting_transcriber.config import TranscriptEntry
+from meeting_transcriber.minutes import MinutesUpdater
+from meeting_transcriber.transcript_store import TranscriptStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# テスト用エントリの基準時刻
+START_TIME = datetime(2024, 1, 1, 10, 0, 0)
+
+
+def _entry(index: int) -> TranscriptEntry:
+    return TranscriptEntry(timestamp=START_TIME + timedelta(seconds=index), text=f'発言{index}', index=index)
+
+
+def _filled_store(count: int, max_in_memory: int) -> TranscriptStore:
+    store = TranscriptStore(max_in_memory=max_in_memory)
+    for i in range(count):
+        store.append(_entry(i))
+    return store
+
+
+class FakeGenerator:
+    """バックエンドを呼ばずに議事録を返す偽のMinutesGenerator."""
+
+    def generate_full(self, transcripts: list[TranscriptEntry], *args, **kwargs) -> str:
+        return f'# 議事録 ({len(transcripts)}件)'
+
+    def generate_incremental(self, current_minutes: str, new_transcripts: list[TranscriptEntry]) -> str:
+        return f'{current_minutes}\n+{len(new_transcripts)}件'
+
+
+def test_spill_keeps_max_in_memory_and_before_limit() -> None:
+    store = _filled_store(10, max_in_memory=3)
+
+    # before より後のエントリは退避しない
+    store.spill(4)
+    assert [e.index for e in store.tail(4)] == list(range(4, 10))
+
+    # 保持上限を超えた分だけ退避する
+    store.spill(10)
+    assert len(store) == 10
+    assert [e.index for e in store.tail(7)] == [7, 8, 9]
+
+
+def test_tail_across_spill_boundary() -> None:
+    store = _filled_store(10, max_in_memory=3)
+    store.spill(10)  # 0〜6 が退避済み、7〜9 がメモリ上
+
+    assert [e.index for e in store.tail(0)] == list(range(10))
+    assert [e.index for e in store.tail(5)] == list(range(5, 10))
+    assert [e.index for e in store.tail(5, 8)] == [5, 6, 7]
+    assert [e.index for e in store.tail(1, 4)] == [1, 2, 3]
+    assert store.tail(10) == []
+
+
+def test_spill_round_trip_preserves_entries() -> None:
+    store = _filled_store(10, max_in_memory=2)
+    expected = [(e.timestamp, e.text, e.index, e.formatted) for e in store.tail(0)]
+
+    store.spill(10)
+    store.spill(10)  # 追加の退避がなくても読み戻しは変わらない
+
+    loaded = store.tail(0)
+    assert [(e.timestamp, e.text, e.index, e.formatted) for e in loaded] == expected
+    # 整形済みの文字列は退避時の値がそのまま使われる
+    assert all('formatted' in e.__dict__ for e in loaded[:8])
+
+
+def test_len_during_concurrent_append_and_spill() -> None:
+    total = 20000
+    store = TranscriptStore(max_in_memory=10)
+    done = threading.Event()
+
+    def writer() -> None:
+        for i in range(total):
+            store.append(_entry(i))
+        done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+
+    previous = 0
+    while not done.is_set():
+        store.spill(len(store))
+        # 退避と追加が並行しても、総件数は減らない
+        current = len(store)
+        assert current >= previous
+        previous = current
+    thread.join()
+
+    store.spill(total)
+    assert len(store) == total
+    assert [e.index for e in store.tail(0)] == list(range(total))
+
+
+def test_first_unsaved_index_recovers_spilled_entries(tmp_path: Path) -> None:
+    store = _filled_store(10, max_in_memory=2)
+    updater = MinutesUpdater(
+        generator=FakeGenerator(),
+        output_dir=tmp_path,
+        template=None,
+        start_time=START_TIME,
+    )
+
+    # 議事録には反映済みだが、文字起こしはまだ保存していない状態で退避する
+    assert updater.update(store.tail(0)).success
+    store.spill(updater.last_update_index)
+    for i in range(10, 15):
+        store.append(_entry(i))
+
+    # 終了処理と同じく、未保存の先頭から読み戻して保存する
+    assert updater.first_unsaved_index() == 0
+    start = updater.first_unsaved_index()
+    assert updater.update(store.tail(updater.last_update_index)).success
+    updater.save(store.tail(start))
+    updater.flush()
+
+    lines = (updater.session_dir / 'transcript_raw.txt').read_text(encoding='utf-8').splitlines()
+    assert lines == [_entry(i).formatted for i in range(15)]
+    assert updater.first_unsaved_index() == 15
+
+
+def test_first_unsaved_index_appends_only_new_entries(tmp_path: Path) -> None:
+    store = _filled_store(10, max_in_memory=2)
+    updater = MinutesUpdater(
+        generator=FakeGenerator(),
+        output_dir=tmp_path,
+        template=None,
+        start_time=START_TIME,
+    )
+
+    assert updater.update(store.tail(0)).success
+    updater.save_transcript_only(store.tail(0))
+    store.spill(updater.last_update_index)
+    for i in range(10, 15):
+        store.append(_entry(i))
+
+    # 保存済みの範囲は読み戻さず、新しい分だけを追記する
+    start = updater.first_unsaved_index()
+    assert start == 10
+    updater.save(store.tail(start))
+    updater.flush()
+
+    lines = (updater.session_dir / 'transcript_raw.txt').read_text(encoding='utf-8').splitlines()
+    assert lines == [_entry(i).formatted for i in range(15)]